@@ -0,0 +1,85 @@
+"""
+Measure nvstrings.parallel() against calling the method directly.
+
+The first call on an instance also copies the rows into shared memory,
+which later calls reuse. Both are timed separately for each number of
+worker processes.
+
+Usage: python bench_parallel.py [--rows N] [--repeat R] [--workers 1,2,4]
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import nvstrings
+
+
+def best_time(fn, repeat):
+    """Return the fastest of repeat calls to fn in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--workers', default=None,
+                        help='comma separated worker counts')
+    args = parser.parse_args()
+    if args.workers is None:
+        workers = [1]
+        while workers[-1] * 2 <= (os.cpu_count() or 1):
+            workers.append(workers[-1] * 2)
+    else:
+        workers = [int(n) for n in args.workers.split(',')]
+
+    values = np.random.RandomState(0).randint(0, 10**9, args.rows)
+    strs = nvstrings.from_ints(values, zero_pad=10)
+    calls = [
+        ('lower', ()),
+        ('contains', ('1[0-9]*5',)),
+        ('replace', ('[0-4]', '-')),
+        ('stoi', ()),
+    ]
+
+    print('{} rows, best of {}'.format(args.rows, args.repeat))
+    print('{:<10}{:>10}'.format('method', 'serial') +
+          ''.join('{:>22}'.format('{} workers first/reuse'.format(n))
+                  for n in workers))
+    for fn_name, fn_args in calls:
+        method = getattr(strs, fn_name)
+        line = '{:<10}'.format(fn_name)
+        line += '{:>9.3f}s'.format(best_time(lambda: method(*fn_args),
+                                             args.repeat))
+        for n in workers:
+            with ProcessPoolExecutor(n) as executor:
+                nvstrings.set_executor(executor, n)
+                # start the worker processes before timing
+                list(executor.map(abs, range(n)))
+                first = []
+
+                def first_call():
+                    rows = strs.sublist(list(range(strs.size())))
+                    start = time.perf_counter()
+                    rows.parallel(fn_name, *fn_args)
+                    first.append(time.perf_counter() - start)
+
+                for _ in range(args.repeat):
+                    first_call()
+                reuse = best_time(lambda: strs.parallel(fn_name, *fn_args),
+                                  args.repeat)
+                line += '{:>22}'.format('{:.3f}s / {:.3f}s'.format(
+                    min(first), reuse))
+            nvstrings.set_executor(None)
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
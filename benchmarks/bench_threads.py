@@ -0,0 +1,92 @@
+"""
+Measure how the host kernels scale with nvstrings.set_num_threads().
+
+The full calls include copying the strings to host memory, which runs
+in the calling thread. The kernel rows time only the chunked numpy
+kernels on buffers copied beforehand.
+
+Usage: python bench_threads.py [--rows N] [--repeat R] [--threads 1,2,4]
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import nvstrings
+
+
+def best_time(fn, repeat):
+    """Return the fastest of repeat calls to fn in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--threads', default=None,
+                        help='comma separated thread counts')
+    args = parser.parse_args()
+    if args.threads is None:
+        threads = [1]
+        while threads[-1] * 2 <= (os.cpu_count() or 1):
+            threads.append(threads[-1] * 2)
+    else:
+        threads = [int(n) for n in args.threads.split(',')]
+
+    values = np.random.RandomState(0).randint(-10**9, 10**9, args.rows)
+    strs = nvstrings.from_ints(values)
+    floats = nvstrings.from_floats(values / 1000.0)
+    chars, offsets, valid = strs._host_buffers()
+    chars = np.concatenate([chars, np.zeros(1, dtype=np.uint8)])
+    lengths = np.diff(offsets)
+    matrix, nbytes = strs._byte_matrix(nvstrings._NUMBER_WIDTH)[1:]
+
+    def hash_kernel(algorithm):
+        return nvstrings._map_chunks(
+            lambda start, stop: nvstrings._hash_rows(
+                algorithm, chars, offsets[start:stop + 1],
+                lengths[start:stop], 0),
+            len(lengths))
+
+    def parse_kernel():
+        return nvstrings._map_chunks(
+            lambda start, stop: nvstrings._parse_int_rows(
+                matrix[start:stop], nbytes[start:stop], 10),
+            len(nbytes))
+
+    kernels = [
+        ('hash murmur3_32', lambda: strs.hash(algorithm='murmur3_32')),
+        ('hash xxhash64', lambda: strs.hash(algorithm='xxhash64')),
+        ('to_int', lambda: strs.to_int()),
+        ('to_float', lambda: floats.to_float()),
+        ('from_ints', lambda: nvstrings.from_ints(values)),
+        ('murmur3 kernel', lambda: hash_kernel('murmur3_32')),
+        ('xxhash64 kernel', lambda: hash_kernel('xxhash64')),
+        ('to_int kernel', parse_kernel),
+    ]
+
+    print('{} rows, best of {}'.format(args.rows, args.repeat))
+    print('{:<16}'.format('kernel') +
+          ''.join('{:>12}'.format('{} thr'.format(n)) for n in threads))
+    for name, fn in kernels:
+        line = '{:<16}'.format(name)
+        base = None
+        for n in threads:
+            nvstrings.set_num_threads(n)
+            seconds = best_time(fn, args.repeat)
+            if base is None:
+                base = seconds
+            line += '{:>12}'.format('{:.3f}s {:.1f}x'.format(
+                seconds, base / seconds))
+        print(line)
+    nvstrings.set_num_threads(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,27 +1,164 @@
 
+import numpy as np
 import pyniNVCategory
 import nvstrings as nvs
 
 
-def to_device(strs):
+def to_device(strs, dtype=None):
     """Create a nvcategory object from a list of strings."""
     cptr = pyniNVCategory.n_createCategoryFromHostStrings(strs)
-    return nvcategory(cptr)
+    return nvcategory(cptr, dtype)
 
 
-def from_strings(*args):
+def from_strings(*args, dtype=None):
     """Create a nvcategory object from a nvstrings object."""
     strs = []
     for arg in args:
         strs.append(arg)
     cptr = pyniNVCategory.n_createCategoryFromNVStrings(strs)
-    return nvcategory(cptr)
+    return nvcategory(cptr, dtype)
 
 
-def from_strings_list(list):
+def from_strings_list(list, dtype=None):
     """Create a nvcategory object from a list of nvstrings."""
     cptr = pyniNVCategory.n_createCategoryFromNVStrings(list)
-    return nvcategory(cptr)
+    return nvcategory(cptr, dtype)
+
+
+def _values_dtype(count):
+    """Return the narrowest unsigned type able to index count keys."""
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if count <= np.iinfo(dtype).max + 1:
+            return np.dtype(dtype)
+    return np.dtype(np.uint64)
+
+
+def _check_values_dtype(dtype, count):
+    """Return dtype if it is an integer type able to index count keys."""
+    dtype = np.dtype(dtype)
+    if dtype.kind not in 'iu' or np.iinfo(dtype).max < count - 1:
+        raise ValueError(
+            "dtype {} cannot hold values for {} keys".format(dtype, count))
+    return dtype
+
+
+def _from_keys_values(keys, values, dtype=None):
+    """
+    Create a nvcategory from sorted unique keys and the values for its
+    rows. Only the keys are placed in the native category so the cost
+    is proportional to the number of keys.
+    """
+    cptr = pyniNVCategory.n_createCategoryFromNVStrings([keys])
+    return nvcategory(cptr, dtype, values)
+
+
+def _from_pickle(keys, values, dtype):
+    """Create a nvcategory from pickled keys and values."""
+    return _from_keys_values(keys, values, dtype)
+
+
+def _from_shared_arrays(chars, offsets, nulls, values):
+    """Create a nvcategory from the arrays of a shared memory segment."""
+    keys = nvs.from_offsets(chars, offsets, nulls)
+    return _from_keys_values(keys, values, values.dtype)
+
+
+def from_shared_memory(name):
+    """
+    Create a nvcategory from a shared memory segment created by
+    nvcategory.to_shared_memory(). The segment is only read so any
+    number of processes can attach to it.
+
+    Parameters
+    ----------
+        name : str
+            Name of the shared memory segment.
+
+    Returns
+    -------
+    A new nvcategory instance
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+      import nvcategory
+      c = nvcategory.to_device(["eee","aaa","eee","dddd"])
+      shm = c.to_shared_memory()
+      c2 = nvcategory.from_shared_memory(shm.name)
+      print(c2.keys())
+      print(c2.values())
+      shm.close()
+      shm.unlink()
+
+    Output:
+
+    .. code-block:: python
+
+      ['aaa','dddd','eee']
+      [2, 0, 2, 1]
+
+    """
+    return nvs._from_shared_memory(name, _from_shared_arrays)
+
+
+def _to_mask(results, values, bitmask):
+    """Broadcast per-key boolean results to each value."""
+    rtn = np.asarray(results, dtype=np.bool_)[values]
+    if bitmask:
+        rtn = np.packbits(rtn, bitorder='little')
+    return rtn
+
+
+def _merge_keys(lkeys, rkeys):
+    """
+    Return the position of each left key within the right keys or -1.
+    Both lists must be sorted. Null keys are never matched.
+    """
+    rtn = np.full(len(lkeys), -1, dtype=np.int64)
+    i = j = 0
+    while i < len(lkeys) and j < len(rkeys):
+        lkey = lkeys[i]
+        rkey = rkeys[j]
+        if lkey is None:
+            i += 1
+        elif rkey is None or rkey < lkey:
+            j += 1
+        elif lkey < rkey:
+            i += 1
+        else:
+            rtn[i] = j
+            i += 1
+            j += 1
+    return rtn
+
+
+def _join_values(lvalues, rvalues, key_map, rkeys_size, how):
+    """
+    Return the left/right row pairs for values joined through key_map.
+    Unmatched left rows are included with right index -1 if how='left'.
+    """
+    # inverted index: rows of each right key are contiguous in order
+    order = np.argsort(rvalues, kind='stable')
+    # unmatched left rows use an extra right key that has no rows
+    counts = np.bincount(rvalues, minlength=rkeys_size + 1)
+    starts = np.cumsum(counts) - counts
+    rkeys = key_map[lvalues]
+    rkeys = np.where(rkeys >= 0, rkeys, rkeys_size)
+    counts = counts[rkeys]
+    if how == 'left':
+        repeats = np.maximum(counts, 1)
+    else:
+        repeats = counts
+    total = int(repeats.sum())
+    lidx = np.repeat(np.arange(len(lvalues), dtype=np.int64), repeats)
+    pos = np.repeat(starts[rkeys], repeats)
+    pos += np.arange(total) - np.repeat(np.cumsum(repeats) - repeats, repeats)
+    valid = np.repeat(counts > 0, repeats)
+    ridx = np.full(total, -1, dtype=np.int64)
+    ridx[valid] = order[pos[valid]]
+    return lidx, ridx
 
 
 class nvcategory:
@@ -29,13 +166,39 @@ class nvcategory:
     Instance manages a dictionary of strings (keys) in device memory
     and a mapping of indexes (values).
 
+    values(dtype=...) returns the values as a numpy array.
+    values_dtype() is the narrowest unsigned integer type that can
+    address all the keys (uint8, uint16 or uint32) unless a specific
+    type is requested when the instance is created.
+    The native library still stores 32-bit values so this only reduces
+    the size of the exported values, not device memory.
+
+    Categories created by transform(), unpickling or
+    from_shared_memory() hold only their keys in the native category
+    and keep the values in host memory using that narrow type.
+    Methods that need the native values of every row, such as
+    add_strings(), first rebuild a native category of all the rows.
+
     """
     #
     m_cptr = 0
 
-    def __init__(self, cptr):
+    def __init__(self, cptr, dtype=None, values=None):
         """For internal use only."""
         self.m_cptr = cptr
+        self._dtype = None
+        # values of the rows when the native category holds only keys
+        self._values = None
+        if dtype is not None:
+            self._dtype = _check_values_dtype(dtype, self.keys_size())
+        if values is not None:
+            self._values = np.array(values, dtype=self.values_dtype())
+
+    def _rows(self):
+        """Return a category holding every row in the native library."""
+        if self._values is None:
+            return self
+        return from_strings(self.to_strings(), dtype=self._dtype)
 
     def __del__(self):
         pyniNVCategory.n_destroyCategory(self.m_cptr)
@@ -47,6 +210,39 @@ class nvcategory:
         return "<nvcategory keys={},values={}>".format(
                 self.keys_size(), self.size())
 
+    def __reduce_ex__(self, protocol):
+        """
+        Pickle the keys and the values rather than the strings.
+        The keys are pickled as nvstrings and the values as a numpy
+        array of values_dtype() so both support out-of-band buffers.
+        """
+        return _from_pickle, (self.keys(), self._host_values(),
+                              self._dtype)
+
+    def to_shared_memory(self, name=None):
+        """
+        Copy the keys and values of this instance into a new shared
+        memory segment. Other processes can create an instance from it
+        using nvcategory.from_shared_memory().
+
+        The caller owns the segment and must call close() on the
+        returned object when done and unlink() once no other process
+        needs to attach to it.
+
+        Parameters
+        ----------
+          name : str
+            Name of the shared memory segment.
+            A unique name is generated if one is not specified.
+
+        Returns
+        -------
+          multiprocessing.shared_memory.SharedMemory: the new segment
+
+        """
+        arrays = self.keys()._shared_arrays() + [self._host_values()]
+        return nvs._to_shared_memory(name, arrays)
+
     def size(self):
         """
         The number of values.
@@ -73,6 +269,8 @@ class nvcategory:
           4
 
         """
+        if self._values is not None:
+            return len(self._values)
         return pyniNVCategory.n_size(self.m_cptr)
 
     def keys_size(self):
@@ -103,6 +301,34 @@ class nvcategory:
         """
         return pyniNVCategory.n_keys_size(self.m_cptr)
 
+    def values_dtype(self):
+        """
+        The integer type used to hold the values of this instance.
+
+        Returns
+        -------
+          numpy.dtype: uint8, uint16 or uint32 unless otherwise requested
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+          import nvcategory
+          c = nvcategory.to_device(["eee","aaa","eee","dddd"])
+          print(c.values_dtype())
+
+        Output:
+
+        .. code-block:: python
+
+          uint8
+
+        """
+        if self._dtype is None:
+            self._dtype = _values_dtype(self.keys_size())
+        return self._dtype
+
     def keys(self):
         """
         Return the unique strings for this category as nvstrings instance.
@@ -163,6 +389,13 @@ class nvcategory:
           [0, 2]
 
         """
+        if self._values is not None:
+            if devptr:
+                return self._rows().indexes_for_key(key, devptr)
+            value = self.value(key)
+            if value < 0:
+                return []
+            return np.flatnonzero(self._values == value).tolist()
         return pyniNVCategory.n_get_indexes_for_key(self.m_cptr, key, devptr)
 
     def value_for_index(self, idx):
@@ -190,6 +423,8 @@ class nvcategory:
           1
 
         """
+        if self._values is not None:
+            return int(self._values[idx])
         return pyniNVCategory.n_get_value_for_index(self.m_cptr, idx)
 
     def value(self, str):
@@ -221,33 +456,59 @@ class nvcategory:
         """
         return pyniNVCategory.n_get_value_for_string(self.m_cptr, str)
 
-    def values(self, devptr=0):
+    def values(self, devptr=0, dtype=None):
         """
         Return all values for this instance.
 
+        The values are returned as a list unless dtype is specified.
+
         Parameters
         ----------
           devptr : GPU memory pointer
             Where index values will be written.
             Must be able to hold size() of int32 values.
 
+          dtype : numpy.dtype
+            Return the values as a numpy array of this integer type,
+            for example values_dtype().
+            Must be able to hold every value in this instance.
+            This is ignored if devptr is specified.
+
         Examples
         --------
 
         .. code-block:: python
 
           import nvcategory
+          import numpy as np
           c = nvcategory.to_device(["eee","aaa","eee","dddd"])
           print(c.values())
+          print(c.values(dtype=c.values_dtype()))
 
         Output:
 
         .. code-block:: python
 
           [2, 0, 2, 1]
+          [2 0 2 1]
 
         """
-        return pyniNVCategory.n_get_values(self.m_cptr, devptr)
+        if devptr:
+            rows = self._rows()
+            return pyniNVCategory.n_get_values(rows.m_cptr, devptr)
+        if dtype is None:
+            if self._values is not None:
+                return self._values.tolist()
+            return pyniNVCategory.n_get_values(self.m_cptr, 0)
+        dtype = _check_values_dtype(dtype, self.keys_size())
+        return self._host_values().astype(dtype, copy=False)
+
+    def _host_values(self):
+        """Return the values as a numpy array of values_dtype()."""
+        if self._values is not None:
+            return self._values
+        return np.asarray(pyniNVCategory.n_get_values(self.m_cptr, 0),
+                          dtype=self.values_dtype())
 
     def add_strings(self, nvs):
         """
@@ -285,7 +546,8 @@ class nvcategory:
           [2, 0, 2, 1, 3, 2, 0]
 
         """
-        rtn = pyniNVCategory.n_add_strings(self.m_cptr, nvs)
+        rows = self._rows()
+        rtn = pyniNVCategory.n_add_strings(rows.m_cptr, nvs)
         if rtn is not None:
             rtn = nvcategory(rtn)
         return rtn
@@ -325,7 +587,8 @@ class nvcategory:
           [1, 1, 0]
 
         """
-        rtn = pyniNVCategory.n_remove_strings(self.m_cptr, nvs)
+        rows = self._rows()
+        rtn = pyniNVCategory.n_remove_strings(rows.m_cptr, nvs)
         if rtn is not None:
             rtn = nvcategory(rtn)
         return rtn
@@ -358,6 +621,8 @@ class nvcategory:
           ['eee','aaa','eee','dddd']
 
         """
+        if self._values is not None:
+            return self.gather_strings(self._values.tolist())
         rtn = pyniNVCategory.n_to_strings(self.m_cptr)
         if rtn is not None:
             rtn = nvs.nvstrings(rtn)
@@ -404,3 +669,475 @@ class nvcategory:
         if rtn is not None:
             rtn = nvs.nvstrings(rtn)
         return rtn
+
+    def contains(self, pat, regex=True, bitmask=False):
+        """
+        Return array of boolean values where True is set for each value
+        whose key contains the specified pattern.
+        The pattern is only evaluated against the keys.
+
+        Parameters
+        ----------
+          pat : str
+            Pattern or string to search for in each key.
+
+          regex : bool
+            If `True`, pat is interpreted as a regex string.
+            If `False`, pat is a string to be searched for in each key.
+
+          bitmask : bool
+            If True, the results are packed into a bit-array (uint8)
+            with the least significant bit of the first byte
+            representing the first value.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+          import nvcategory
+          c = nvcategory.to_device(["eee","aaa","eee","dddd"])
+          print(c.contains('e'))
+
+        Output:
+
+        .. code-block:: python
+
+          [ True False  True False]
+
+        """
+        rtn = self.keys().contains(pat, regex)
+        return _to_mask(rtn, self._host_values(), bitmask)
+
+    def match(self, pat, bitmask=False):
+        """
+        Return array of boolean values where True is set for each value
+        whose key matches the specified pattern at the beginning.
+        The pattern is only evaluated against the keys.
+
+        Parameters
+        ----------
+          pat : str
+            Pattern to find.
+
+          bitmask : bool
+            If True, the results are packed into a bit-array (uint8)
+            with the least significant bit of the first byte
+            representing the first value.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+          import nvcategory
+          c = nvcategory.to_device(["eee","aaa","eee","dddd"])
+          print(c.match('d'))
+
+        Output:
+
+        .. code-block:: python
+
+          [False False False  True]
+
+        """
+        rtn = self.keys().match(pat)
+        return _to_mask(rtn, self._host_values(), bitmask)
+
+    def startswith(self, pat, bitmask=False):
+        """
+        Return array of boolean values where True is set for each value
+        whose key begins with the specified string.
+        The pattern is only evaluated against the keys.
+
+        Parameters
+        ----------
+          pat : str
+            String to find. Regular expressions are not accepted.
+
+          bitmask : bool
+            If True, the results are packed into a bit-array (uint8)
+            with the least significant bit of the first byte
+            representing the first value.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+          import nvcategory
+          c = nvcategory.to_device(["eee","aaa","eee","dddd"])
+          print(c.startswith('a'))
+
+        Output:
+
+        .. code-block:: python
+
+          [False  True False False]
+
+        """
+        rtn = self.keys().startswith(pat)
+        return _to_mask(rtn, self._host_values(), bitmask)
+
+    def endswith(self, pat, bitmask=False):
+        """
+        Return array of boolean values where True is set for each value
+        whose key ends with the specified string.
+        The pattern is only evaluated against the keys.
+
+        Parameters
+        ----------
+          pat : str
+            String to find. Regular expressions are not accepted.
+
+          bitmask : bool
+            If True, the results are packed into a bit-array (uint8)
+            with the least significant bit of the first byte
+            representing the first value.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+          import nvcategory
+          c = nvcategory.to_device(["eee","aaa","eee","dddd"])
+          print(c.endswith('d'))
+
+        Output:
+
+        .. code-block:: python
+
+          [False False False  True]
+
+        """
+        rtn = self.keys().endswith(pat)
+        return _to_mask(rtn, self._host_values(), bitmask)
+
+    def isalnum(self, bitmask=False):
+        """
+        Return array of boolean values where True is set for each value
+        whose key contains only alpha-numeric characters.
+        See nvstrings.isalnum() for details.
+
+        Parameters
+        ----------
+          bitmask : bool
+            If True, the results are packed into a bit-array (uint8)
+            with the least significant bit of the first byte
+            representing the first value.
+
+        """
+        rtn = self.keys().isalnum()
+        return _to_mask(rtn, self._host_values(), bitmask)
+
+    def isalpha(self, bitmask=False):
+        """
+        Return array of boolean values where True is set for each value
+        whose key contains only alphabetic characters.
+        See nvstrings.isalpha() for details.
+
+        Parameters
+        ----------
+          bitmask : bool
+            If True, the results are packed into a bit-array (uint8)
+            with the least significant bit of the first byte
+            representing the first value.
+
+        """
+        rtn = self.keys().isalpha()
+        return _to_mask(rtn, self._host_values(), bitmask)
+
+    def isdigit(self, bitmask=False):
+        """
+        Return array of boolean values where True is set for each value
+        whose key contains only digit characters.
+        See nvstrings.isdigit() for details.
+
+        Parameters
+        ----------
+          bitmask : bool
+            If True, the results are packed into a bit-array (uint8)
+            with the least significant bit of the first byte
+            representing the first value.
+
+        """
+        rtn = self.keys().isdigit()
+        return _to_mask(rtn, self._host_values(), bitmask)
+
+    def isspace(self, bitmask=False):
+        """
+        Return array of boolean values where True is set for each value
+        whose key contains only whitespace characters.
+        See nvstrings.isspace() for details.
+
+        Parameters
+        ----------
+          bitmask : bool
+            If True, the results are packed into a bit-array (uint8)
+            with the least significant bit of the first byte
+            representing the first value.
+
+        """
+        rtn = self.keys().isspace()
+        return _to_mask(rtn, self._host_values(), bitmask)
+
+    def isdecimal(self, bitmask=False):
+        """
+        Return array of boolean values where True is set for each value
+        whose key contains only decimal characters.
+        See nvstrings.isdecimal() for details.
+
+        Parameters
+        ----------
+          bitmask : bool
+            If True, the results are packed into a bit-array (uint8)
+            with the least significant bit of the first byte
+            representing the first value.
+
+        """
+        rtn = self.keys().isdecimal()
+        return _to_mask(rtn, self._host_values(), bitmask)
+
+    def isnumeric(self, bitmask=False):
+        """
+        Return array of boolean values where True is set for each value
+        whose key contains only numeric characters.
+        See nvstrings.isnumeric() for details.
+
+        Parameters
+        ----------
+          bitmask : bool
+            If True, the results are packed into a bit-array (uint8)
+            with the least significant bit of the first byte
+            representing the first value.
+
+        """
+        rtn = self.keys().isnumeric()
+        return _to_mask(rtn, self._host_values(), bitmask)
+
+    def islower(self, bitmask=False):
+        """
+        Return array of boolean values where True is set for each value
+        whose key contains only lowercase characters.
+        See nvstrings.islower() for details.
+
+        Parameters
+        ----------
+          bitmask : bool
+            If True, the results are packed into a bit-array (uint8)
+            with the least significant bit of the first byte
+            representing the first value.
+
+        """
+        rtn = self.keys().islower()
+        return _to_mask(rtn, self._host_values(), bitmask)
+
+    def isupper(self, bitmask=False):
+        """
+        Return array of boolean values where True is set for each value
+        whose key contains only uppercase characters.
+        See nvstrings.isupper() for details.
+
+        Parameters
+        ----------
+          bitmask : bool
+            If True, the results are packed into a bit-array (uint8)
+            with the least significant bit of the first byte
+            representing the first value.
+
+        """
+        rtn = self.keys().isupper()
+        return _to_mask(rtn, self._host_values(), bitmask)
+
+    def transform(self, fn_name, *args, **kwargs):
+        """
+        Apply an nvstrings method to the keys only and return a new
+        category with the resulting keys.
+
+        Keys that become equal are merged and the values are remapped
+        on the host. Only the keys are processed by the native library
+        so its cost is proportional to keys_size() instead of size().
+        The result holds its values in host memory (see the class
+        description).
+
+        Parameters
+        ----------
+          fn_name : str
+            Name of the nvstrings method to apply to the keys.
+            The method must return a new nvstrings instance with one
+            string for each key (e.g. 'lower', 'strip', 'slice').
+
+          args, kwargs
+            Parameters passed to the nvstrings method.
+
+        Returns
+        -------
+          nvcategory: new category with transformed keys
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+          import nvcategory
+          c = nvcategory.to_device(["eee","aaa","EEE","dddd"])
+          t = c.transform('lower')
+          print(t.keys())
+          print(t.values())
+
+        Output:
+
+        .. code-block:: python
+
+          ['aaa','dddd','eee']
+          [2, 0, 2, 1]
+
+        """
+        keys = self.keys()
+        rtn = getattr(keys, fn_name)(*args, **kwargs)
+        if not isinstance(rtn, nvs.nvstrings) or \
+           rtn.size() != keys.size():
+            raise ValueError(
+                "{} does not return a string for each key".format(fn_name))
+        kcat = from_strings(rtn)
+        values = kcat._host_values()[self._host_values()]
+        return _from_keys_values(kcat.keys(), values, self._dtype)
+
+    def join(self, other, how='inner'):
+        """
+        Return the row index pairs where the strings of this instance
+        equal the strings of the other instance.
+
+        The keys of each category are matched once and the rows are
+        paired through the values so no strings are compared per row.
+        Null strings do not match.
+
+        Parameters
+        ----------
+          other : nvcategory
+            Category to join with.
+
+          how : str
+            'inner' returns only matching pairs.
+            'left' also returns each unmatched row of this instance
+            paired with -1.
+
+        Returns
+        -------
+          tuple: two int64 numpy arrays of left and right row indexes
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+          import nvcategory
+          c1 = nvcategory.to_device(["eee","aaa","eee","dddd"])
+          c2 = nvcategory.to_device(["aaa","eee","fff"])
+          print(c1.join(c2))
+          print(c1.join(c2, how='left'))
+
+        Output:
+
+        .. code-block:: python
+
+          (array([0, 1, 2]), array([1, 0, 1]))
+          (array([0, 1, 2, 3]), array([ 1,  0,  1, -1]))
+
+        """
+        if how not in ('inner', 'left'):
+            raise ValueError("how must be 'inner' or 'left'")
+        key_map = _merge_keys(self.keys().to_host(), other.keys().to_host())
+        return _join_values(self._host_values(), other._host_values(),
+                            key_map, other.keys_size(), how)
+
+
+class Builder:
+    """
+    Builds a category incrementally from batches of strings.
+
+    Each batch is assigned provisional values immediately. The keys are
+    kept in a hash table so memory is bounded by the number of unique
+    strings rather than the total number of rows.
+    Call build() once all batches are added to create the sorted keys
+    category and the mapping from provisional to final values.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+      import nvcategory, nvstrings
+      b = nvcategory.Builder()
+      print(b.add(nvstrings.to_device(["eee","aaa","eee"])))
+      print(b.add(nvstrings.to_device(["dddd","aaa"])))
+      c, remap = b.build()
+      print(c.keys())
+      print(remap)
+
+    Output:
+
+    .. code-block:: python
+
+      [1 0 1]
+      [2 0]
+      ['aaa','dddd','eee']
+      [0 2 1]
+
+    """
+
+    def __init__(self):
+        self._keys = []
+        self._ids = {}
+
+    def keys_size(self):
+        """The number of unique strings added so far."""
+        return len(self._keys)
+
+    def add(self, strs):
+        """
+        Add a batch of strings and return their provisional values.
+
+        Parameters
+        ----------
+          strs : nvstrings
+            Strings to be added.
+
+        Returns
+        -------
+          numpy.ndarray: uint32 provisional value for each string
+
+        """
+        cat = from_strings(strs)
+        keys = cat.keys().to_host()
+        ids = np.empty(len(keys), dtype=np.uint32)
+        for i, key in enumerate(keys):
+            id = self._ids.get(key)
+            if id is None:
+                id = len(self._keys)
+                self._ids[key] = id
+                self._keys.append(key)
+            ids[i] = id
+        return ids[cat._host_values()]
+
+    def build(self, dtype=None):
+        """
+        Create a category of the sorted unique strings.
+
+        Parameters
+        ----------
+          dtype : numpy.dtype
+            Integer type for the values of the new category.
+
+        Returns
+        -------
+          tuple: nvcategory with one row for each key in order of
+          the provisional values and a numpy array mapping each
+          provisional value to its final value
+
+        """
+        # the keys are unique so the value of each provisional key is
+        # its final value in the order defined by the native library
+        rtn = to_device(self._keys, dtype)
+        return rtn, rtn.values(dtype=rtn.values_dtype())
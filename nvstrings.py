@@ -1,3 +1,9 @@
+import bisect
+import os
+import pickle
+import sys
+import threading
+import numpy as np
 import pyniNVStrings
 
 
@@ -7,6 +13,587 @@ def to_device(strs):
     return nvstrings(cptr)
 
 
+def from_offsets(chars, offsets, nulls=None):
+    """
+    Create nvstrings instance from UTF-8 characters and offsets.
+
+    Parameters
+    ----------
+        chars : numpy array or buffer
+            UTF-8 bytes of all the strings.
+        offsets : numpy array
+            Integer array of size()+1 values. String i is made up of
+            the bytes from offsets[i] to offsets[i+1].
+        nulls : numpy array
+            Optional bit-array (uint8) with a bit set for each string
+            that is not null. The least significant bit of the first
+            byte represents the first string.
+
+    Returns
+    -------
+    A new nvstrings instance
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+      import nvstrings
+      import numpy as np
+      chars = np.frombuffer(b'helloworld', dtype=np.uint8)
+      offsets = np.array([0, 5, 5, 10], dtype=np.int32)
+      nulls = np.array([5], dtype=np.uint8)
+      print(nvstrings.from_offsets(chars, offsets, nulls))
+
+    Output:
+
+    .. code-block:: python
+
+      ['hello', None, 'world']
+
+    """
+    chars = np.frombuffer(memoryview(chars).cast('B'), dtype=np.uint8)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    strs = _decode_offsets(chars, offsets)
+    if nulls is not None:
+        valid = np.unpackbits(np.asarray(nulls, dtype=np.uint8),
+                              count=len(strs), bitorder='little')
+        for i in np.flatnonzero(valid == 0):
+            strs[i] = None
+    return to_device(strs)
+
+
+def _decode_offsets(chars, offsets):
+    """
+    Return the strings between the offsets of the UTF-8 chars. A byte
+    value that does not occur in chars is inserted between the strings
+    so all of them are decoded and split by single calls.
+    """
+    if len(offsets) < 2:
+        return []
+    chars = chars[offsets[0]:offsets[-1]]
+    offsets = offsets - offsets[0]
+    data = chars.tobytes()
+    for sep in range(128):
+        if data.find(bytes([sep])) < 0:
+            chars = np.insert(chars, offsets[1:-1], sep)
+            return chars.tobytes().decode('utf-8').split(chr(sep))
+    offsets = offsets.tolist()
+    return [data[offsets[i]:offsets[i + 1]].decode('utf-8')
+            for i in range(len(offsets) - 1)]
+
+
+def _encode_strings(strs):
+    """
+    Return the UTF-8 characters of the strings and the byte count of
+    each. The strings are joined by a character that does not occur in
+    any of them so they are all encoded by a single call.
+    """
+    if not strs:
+        return np.zeros(0, dtype=np.uint8), np.zeros(0, dtype=np.int64)
+    for sep in range(128):
+        chars = chr(sep).join(strs).encode('utf-8')
+        chars = np.frombuffer(chars, dtype=np.uint8)
+        ends = np.flatnonzero(chars == sep)
+        if len(ends) == len(strs) - 1:
+            lengths = np.diff(ends, prepend=-1, append=len(chars)) - 1
+            return chars[chars != sep], lengths
+    strs = [str.encode('utf-8') for str in strs]
+    lengths = np.array([len(b) for b in strs], dtype=np.int64)
+    return np.frombuffer(b''.join(strs), dtype=np.uint8), lengths
+
+
+def _from_buffers(chars, offsets, dtype, nulls):
+    """Create nvstrings instance from pickled buffers."""
+    offsets = np.frombuffer(offsets, dtype=dtype)
+    if nulls is not None:
+        nulls = np.frombuffer(nulls, dtype=np.uint8)
+    return from_offsets(chars, offsets, nulls)
+
+
+# held while _attach_shared_memory replaces resource_tracker.register
+# so segments created meanwhile by this module are still registered
+_attach_lock = threading.Lock()
+
+
+def _to_shared_memory(name, arrays):
+    """
+    Copy numpy arrays into a new shared memory segment.
+    The segment starts with an int64 header holding the number of
+    arrays followed by the type code, position and size of each.
+    """
+    from multiprocessing import shared_memory
+    arrays = [np.ascontiguousarray(array) for array in arrays]
+    header = np.zeros(1 + 3 * len(arrays), dtype=np.int64)
+    header[0] = len(arrays)
+    pos = header.nbytes
+    for i, array in enumerate(arrays):
+        pos = (pos + 7) // 8 * 8
+        header[1 + 3 * i:4 + 3 * i] = (ord(array.dtype.char), pos,
+                                       array.size)
+        pos += array.nbytes
+    with _attach_lock:
+        rtn = shared_memory.SharedMemory(name=name, create=True, size=pos)
+    rtn.buf[:header.nbytes] = header.tobytes()
+    for i, array in enumerate(arrays):
+        start = int(header[2 + 3 * i])
+        rtn.buf[start:start + array.nbytes] = array.tobytes()
+    return rtn
+
+
+def _attach_shared_memory(name):
+    """
+    Attach to an existing shared memory segment without registering it
+    with the resource tracker. Before Python 3.13 every attach registers
+    the segment and the tracker of a reader that exits unlinks it while
+    the owner and other readers still need it.
+    """
+    from multiprocessing import resource_tracker, shared_memory
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # unregistering afterwards would also drop the registration of an
+    # owner sharing the same tracker, e.g. a process pool
+    with _attach_lock:
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+def _from_shared_memory(name, build):
+    """
+    Attach to a shared memory segment created by _to_shared_memory and
+    return the result of calling build with read-only views of its
+    arrays. The segment is detached before returning.
+    """
+    shm = _attach_shared_memory(name)
+    buf = shm.buf.toreadonly()
+    try:
+        count = int(np.frombuffer(buf, dtype=np.int64, count=1)[0])
+        header = np.frombuffer(buf, dtype=np.int64, count=1 + 3 * count)
+        arrays = [np.frombuffer(buf, dtype=np.dtype(chr(code)),
+                                count=size, offset=pos)
+                  for code, pos, size in header[1:].reshape(count, 3)]
+        rtn = build(*arrays)
+    except BaseException:
+        header = arrays = None
+        try:
+            buf.release()
+            shm.close()
+        except BufferError:
+            # the traceback still holds views of the segment, which is
+            # detached once they are collected
+            pass
+        raise
+    # views must be released before the segment can be closed
+    del header, arrays
+    buf.release()
+    shm.close()
+    return rtn
+
+
+def from_shared_memory(name):
+    """
+    Create nvstrings instance from a shared memory segment created by
+    to_shared_memory(). The segment is only read so any number of
+    processes can attach to it. It remains until the owner of the
+    segment calls unlink().
+
+    Parameters
+    ----------
+        name : str
+            Name of the shared memory segment.
+
+    Returns
+    -------
+    A new nvstrings instance
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+      import nvstrings
+      s = nvstrings.to_device(["hello", None, "world"])
+      shm = s.to_shared_memory()
+      print(nvstrings.from_shared_memory(shm.name))
+      shm.close()
+      shm.unlink()
+
+    Output:
+
+    .. code-block:: python
+
+      ['hello', None, 'world']
+
+    """
+    return _from_shared_memory(name, from_offsets)
+
+
+# executor used by nvstrings.parallel()
+_executor = None
+_executor_workers = 1
+
+# element-wise methods that nvstrings.parallel() can split by rows
+_PARALLEL_METHODS = frozenset([
+    'len', 'compare', 'hash', 'stoi', 'stof', 'to_int', 'is_integer',
+    'to_float', 'is_float', 'to_timestamp', 'ip_to_int', 'is_ipv4',
+    'get', 'repeat', 'pad', 'ljust', 'center', 'rjust', 'zfill', 'wrap',
+    'slice', 'slice_from', 'slice_replace', 'replace', 'lstrip', 'strip',
+    'rstrip', 'lower', 'upper', 'capitalize', 'swapcase', 'title',
+    'index', 'rindex', 'find', 'rfind', 'contains', 'match', 'count',
+    'startswith', 'endswith', 'extract', 'extract_column', 'isalnum',
+    'isalpha', 'isdigit', 'isspace', 'isdecimal', 'isnumeric', 'islower',
+    'isupper', 'translate'])
+
+# methods of _PARALLEL_METHODS that return a list of columns
+_PARALLEL_COLUMNS = frozenset(['extract_column'])
+
+# fewest rows given to each chunk by nvstrings.parallel()
+_PARALLEL_MIN_ROWS = 10000
+
+
+def set_executor(executor, workers=None):
+    """
+    Set the concurrent.futures executor used by nvstrings.parallel().
+
+    With a ProcessPoolExecutor each chunk of rows is processed in a
+    separate process, reading the strings from shared memory.
+
+    Parameters
+    ----------
+        executor : concurrent.futures.Executor
+            Executor to use or None to process all rows in the calling
+            thread.
+
+        workers : int
+            Number of chunks to split the rows into, normally the
+            number of workers of the executor.
+            The default is the number of CPUs.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+      import nvstrings
+      from concurrent.futures import ProcessPoolExecutor
+      nvstrings.set_executor(ProcessPoolExecutor(4), 4)
+      s = nvstrings.to_device(["Hello", "World"])
+      print(s.parallel('lower'))
+
+    Output:
+
+    .. code-block:: python
+
+      ['hello', 'world']
+
+    """
+    global _executor, _executor_workers
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    _executor = executor
+    _executor_workers = workers
+
+
+# threads used by the host kernels and the fewest rows in each chunk
+_num_threads = 1
+_min_chunk_rows = 32768
+_thread_pool = None
+# guards creating, replacing and submitting to _thread_pool
+_thread_lock = threading.Lock()
+
+
+def set_num_threads(num_threads, min_chunk_rows=None):
+    """
+    Set the number of threads used by the numpy kernels of
+    hash() with an algorithm, to_int(), is_integer(), to_float(),
+    is_float() and from_ints().
+
+    The rows are split into min(num_threads, rows // min_chunk_rows)
+    chunks of equal size which are processed concurrently. Smaller
+    inputs are processed in the calling thread.
+    Only the kernels are split. Copying the strings to host memory
+    before a kernel runs, and all the methods implemented by the native
+    library, still run in the calling thread. The overall speedup
+    therefore depends on how much of a call is spent in the kernel.
+    This function and the kernels may be called from several threads.
+
+    Parameters
+    ----------
+        num_threads : int
+            Number of threads. 1 processes all rows in the calling
+            thread.
+
+        min_chunk_rows : int
+            Fewest rows in each chunk. The default is 32768.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+      import nvstrings
+      nvstrings.set_num_threads(4)
+      print(nvstrings.get_num_threads())
+
+    Output:
+
+    .. code-block:: python
+
+      4
+
+    """
+    global _num_threads, _min_chunk_rows, _thread_pool
+    if num_threads < 1:
+        raise ValueError("num_threads must be at least 1")
+    if min_chunk_rows is not None and min_chunk_rows < 1:
+        raise ValueError("min_chunk_rows must be at least 1")
+    with _thread_lock:
+        if min_chunk_rows is not None:
+            _min_chunk_rows = min_chunk_rows
+        if num_threads != _num_threads and _thread_pool is not None:
+            # chunks already submitted still complete
+            _thread_pool.shutdown(wait=False)
+            _thread_pool = None
+        _num_threads = num_threads
+
+
+def get_num_threads():
+    """Return the number of threads used by the host kernels."""
+    return _num_threads
+
+
+def _map_chunks(kernel, count):
+    """
+    Call kernel(start, stop) for chunks of count rows on the thread pool
+    and concatenate the numpy arrays it returns. A tuple of arrays is
+    concatenated element-wise.
+    """
+    global _thread_pool
+    with _thread_lock:
+        nchunks = min(_num_threads, count // _min_chunk_rows)
+        if nchunks > 1:
+            if _thread_pool is None:
+                from concurrent.futures import ThreadPoolExecutor
+                _thread_pool = ThreadPoolExecutor(_num_threads)
+            bounds = np.linspace(0, count, nchunks + 1).astype(np.int64)
+            bounds = bounds.tolist()
+            futures = [_thread_pool.submit(kernel, start, stop)
+                       for start, stop in zip(bounds[:-1], bounds[1:])]
+    if nchunks <= 1:
+        return kernel(0, count)
+    results = [future.result() for future in futures]
+    if isinstance(results[0], tuple):
+        return tuple(np.concatenate(column) for column in zip(*results))
+    return np.concatenate(results)
+
+
+def _run_chunk(name, start, stop, fn_name, args, kwargs):
+    """
+    Call method fn_name on rows [start, stop) of the strings in the
+    shared memory segment name.
+    """
+    def build(chars, offsets, nulls):
+        offsets = offsets[start:stop + 1]
+        valid = np.unpackbits(nulls, count=stop, bitorder='little')
+        return from_offsets(chars[offsets[0]:offsets[-1]],
+                            offsets - offsets[0],
+                            np.packbits(valid[start:], bitorder='little'))
+
+    strs = _from_shared_memory(name, build)
+    rtn = getattr(strs, fn_name)(*args, **kwargs)
+    if isinstance(rtn, nvstrings):
+        return _Buffers(rtn)
+    if fn_name in _PARALLEL_COLUMNS:
+        return [column if column is None else _Buffers(column)
+                for column in rtn]
+    return rtn
+
+
+class _Buffers:
+    """
+    The UTF-8 characters, offsets and validity of the strings returned
+    for a chunk by nvstrings.parallel() so the strings of all the
+    chunks are joined by a single from_offsets() call.
+    """
+
+    def __init__(self, strs):
+        self.chars, self.offsets, self.valid = strs._host_buffers()
+
+
+def _concat_results(results, columns=False):
+    """
+    Concatenate the results of the chunks of nvstrings.parallel().
+    If columns is True, each result is a list of columns which are
+    concatenated separately. Otherwise lists have one entry per row.
+    """
+    first = results[0]
+    if isinstance(first, _Buffers):
+        chars = np.concatenate([rtn.chars for rtn in results])
+        lengths = np.concatenate([np.diff(rtn.offsets) for rtn in results])
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        valid = np.concatenate([rtn.valid for rtn in results])
+        return from_offsets(chars, offsets,
+                            np.packbits(valid, bitorder='little'))
+    if isinstance(first, np.ndarray):
+        return np.concatenate(results)
+    if isinstance(first, tuple):
+        return tuple(_concat_results(list(column))
+                     for column in zip(*results))
+    if columns:
+        return [_concat_results(list(column)) for column in zip(*results)]
+    return [value for rtn in results for value in rtn]
+
+
+def from_ints(values, base=10, zero_pad=0):
+    """
+    Create nvstrings instance from integer values.
+
+    The digits of all the values are computed by numpy operations
+    into a single buffer which is decoded once.
+
+    Parameters
+    ----------
+        values : numpy array
+            Integer values to convert.
+        base : int
+            Base of the representation from 2 to 16.
+            Digits above 9 are lowercase letters.
+        zero_pad : int
+            Minimum number of characters of each string.
+            Shorter strings are padded with zeros after the sign.
+
+    Returns
+    -------
+    A new nvstrings instance
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+      import nvstrings
+      import numpy as np
+      print(nvstrings.from_ints(np.array([12, -3, 450])))
+      print(nvstrings.from_ints(np.array([255, 10]), base=16, zero_pad=4))
+
+    Output:
+
+    .. code-block:: python
+
+      ['12', '-3', '450']
+      ['00ff', '000a']
+
+    """
+    values = np.atleast_1d(values)
+    if values.dtype.kind not in 'iu':
+        raise ValueError("values must be integers")
+    if not 2 <= base <= 16:
+        raise ValueError("base must be from 2 to 16")
+    negative = values < 0
+    if values.dtype.kind == 'i':
+        values = values.astype(np.int64).view(np.uint64)
+        values = np.where(negative, np.uint64(0) - values, values)
+    else:
+        values = values.astype(np.uint64)
+
+    def kernel(start, stop):
+        return _format_ints(values[start:stop], negative[start:stop],
+                            base, zero_pad)
+
+    chars = _map_chunks(kernel, len(values))
+    strs = chars.tobytes().decode('ascii').split(',')
+    strs.pop()
+    return to_device(strs)
+
+
+def _format_ints(values, negative, base, zero_pad):
+    """
+    Return the characters of the strings for the magnitudes in values.
+    Each string is followed by a comma.
+    """
+    ndigits_max = 1
+    top = int(values.max(initial=0))
+    while top >= base ** ndigits_max:
+        ndigits_max += 1
+    if top <= np.iinfo(np.uint32).max:
+        values = values.astype(np.uint32)
+    powers = np.array([base ** i for i in range(1, ndigits_max)],
+                      dtype=values.dtype)
+    ndigits = np.searchsorted(powers, values, side='right') + 1
+    ndigits = np.maximum(ndigits, zero_pad - negative)
+    # strings are right aligned in rows of width characters
+    width = max(ndigits_max + 1, zero_pad) + 1
+    matrix = np.zeros((len(values), width), dtype=np.uint8)
+    divisor = values.dtype.type(base)
+    for i in range(2, ndigits_max + 2):
+        values, matrix[:, width - i] = np.divmod(values, divisor)
+    lengths = ndigits + negative + 1
+    if base <= 10:
+        matrix += ord('0')
+    else:
+        matrix = np.frombuffer(b'0123456789abcdef', dtype=np.uint8)[matrix]
+    rows = np.flatnonzero(negative)
+    matrix[rows, width - lengths[rows]] = ord('-')
+    matrix[:, width - 1] = ord(',')
+    return matrix[np.arange(width) >= width - lengths[:, None]]
+
+
+def from_floats(values, precision=6, fmt='g'):
+    """
+    Create nvstrings instance from floating point values.
+
+    All the values are formatted by a single Python string formatting
+    operation since numpy has no vectorized float formatting.
+
+    Parameters
+    ----------
+        values : numpy array
+            Values to convert.
+        precision : int
+            Number of digits after the decimal point for 'f' and 'e'
+            or the number of significant digits for 'g'.
+        fmt : str
+            Either 'g', 'f' or 'e' as in Python string formatting.
+
+    Returns
+    -------
+    A new nvstrings instance
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+      import nvstrings
+      import numpy as np
+      values = np.array([1.5, -0.125, 1e20])
+      print(nvstrings.from_floats(values))
+      print(nvstrings.from_floats(values, 2, 'f'))
+
+    Output:
+
+    .. code-block:: python
+
+      ['1.5', '-0.125', '1e+20']
+      ['1.50', '-0.12', '100000000000000000000.00']
+
+    """
+    if fmt not in ('g', 'f', 'e'):
+        raise ValueError("fmt must be 'g', 'f' or 'e'")
+    values = np.atleast_1d(np.asarray(values, dtype=np.float64))
+    fmt = '%.{}{}\n'.format(precision, fmt)
+    strs = ((fmt * len(values)) % tuple(values.tolist())).split('\n')
+    strs.pop()
+    return to_device(strs)
+
+
 def from_csv(csv, column, lines=0, flags=0):
     """
     Reads a column of values from a CSV file into a new nvstrings instance.
@@ -70,250 +657,1455 @@ def bind_cpointer(cptr):
     return rtn
 
 
-# this will be documented with all the public methods
-class nvstrings:
+def order_by(strs, asc=True, stype=2):
     """
-    Instance manages a list of strings in device memory.
+    Return the indexes that sort multiple nvstrings instances together.
+
+    The first instance is the primary sort column and ties are ordered
+    by the next instance and so on. The sort is stable and uses the
+    sort keys of each instance so no composite strings are created.
+
+    Parameters
+    ----------
+        strs : list of nvstrings
+            Instances to sort by. All must have the same size().
+        asc : bool or list of bool
+            Whether to sort ascending (True) or descending (False).
+            A list specifies the direction for each instance.
+        stype : int
+            Type of sort to use for each instance.
+            See nvstrings.sort() for details.
+
+    Returns
+    -------
+    A numpy int32 array of indexes in sorted order
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+      import nvstrings
+      s1 = nvstrings.to_device(["b","a","b","a"])
+      s2 = nvstrings.to_device(["x","y","w","z"])
+      print(nvstrings.order_by([s1,s2], asc=[True,False]))
+
+    Output:
+
+    .. code-block:: python
+
+      [3 1 0 2]
 
-    Operations are across all of the strings and their results reside in
-    device memory. Strings in the list are immutable.
-    Methods that modify any string will create a new nvstrings instance.
     """
-    #
-    m_cptr = 0
+    if isinstance(asc, bool):
+        asc = [asc] * len(strs)
+    if len(asc) != len(strs):
+        raise ValueError("asc must have a value for each instance")
+    count = strs[0].size() if strs else 0
+    if any(s.size() != count for s in strs):
+        raise ValueError("all instances must be the same size")
+    # least significant column first; each pass is stable
+    rtn = np.arange(count, dtype=np.int32)
+    for s, a in reversed(list(zip(strs, asc))):
+        rtn = s._order_rows(rtn, stype, a)
+    return rtn
 
-    def __init__(self, cptr):
-        """
-        Use to_device() to create new instance from Python array of strings.
-        """
-        self.m_cptr = cptr
 
-    def __del__(self):
-        pyniNVStrings.n_destroyStrings(self.m_cptr)
-        self.m_cptr = 0
+def _expand_ranges(starts, counts):
+    """Return the group and position of each element of the ranges."""
+    groups = np.repeat(np.arange(len(counts)), counts)
+    pos = np.repeat(starts - np.cumsum(counts) + counts, counts)
+    return groups, pos + np.arange(len(pos))
 
-    def __str__(self):
-        return str(pyniNVStrings.n_createHostStrings(self.m_cptr))
 
-    def __repr__(self):
-        return "<nvstrings count={}>".format(self.size())
+def _gather_columns(columns, pos):
+    """
+    Return the strings at the specified positions of the columns
+    as if they were concatenated.
+    """
+    import nvcategory
+    cat = nvcategory.from_strings_list(columns)
+    return cat.gather_strings(cat._host_values()[pos].tolist())
+
+
+def _valid_columns(columns):
+    """Return a bool matrix which is False for the null entries."""
+    return np.stack([np.asarray(col.len()) >= 0 for col in columns], axis=1)
+
+
+def _hash_index(strs):
+    """Return the hash values of strs in sorted order and their rows."""
+    hashes = np.asarray(strs.hash(), dtype=np.uint32)
+    rows = np.argsort(hashes, kind='stable')
+    return hashes[rows], rows
+
+
+def _probe(index, build, strs):
+    """
+    Return the row pairs of strs and build with equal strings
+    using the hash index of build.
+    """
+    hashes, rows = index
+    probe = np.asarray(strs.hash(), dtype=np.uint32)
+    starts = np.searchsorted(hashes, probe, 'left')
+    counts = np.searchsorted(hashes, probe, 'right') - starts
+    pidx, pos = _expand_ranges(starts, counts)
+    bidx = rows[pos]
+    # hash matches are verified with the sort keys and then the bytes
+    pkeys = strs._keys()
+    bkeys = build._keys()
+    equal = pkeys[2][pidx] >= 0
+    for pkey, bkey in zip(pkeys, bkeys):
+        equal &= pkey[pidx] == bkey[bidx]
+    pidx = pidx[equal]
+    bidx = bidx[equal]
+    check = np.flatnonzero(pkeys[2][pidx] == 9)
+    if len(check):
+        pstrs = strs.sublist(pidx[check].tolist()).to_host()
+        bstrs = build.sublist(bidx[check].tolist()).to_host()
+        equal = np.ones(len(pidx), dtype=np.bool_)
+        equal[check] = [a == b for a, b in zip(pstrs, bstrs)]
+        pidx = pidx[equal]
+        bidx = bidx[equal]
+    return pidx, bidx
+
+
+def join_indices(left, right, how='inner'):
+    """
+    Return the indexes of the strings that are equal in two instances.
+
+    A hash index is built over the smaller instance using hash() and
+    probed with the other. Matching hash values are confirmed by
+    comparing the strings. Null strings do not match.
+
+    Parameters
+    ----------
+        left : nvstrings
+            Left side of the join.
+        right : nvstrings
+            Right side of the join.
+        how : str
+            'inner' returns the index pairs of all matching strings.
+            'left' also returns each unmatched left index paired
+            with -1.
+            'semi' returns the left indexes that have a match.
+            'anti' returns the left indexes that have no match.
+
+    Returns
+    -------
+    Two numpy int64 arrays of left and right indexes ordered by the
+    left index, or only the left indexes for 'semi' and 'anti'.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+      import nvstrings
+      s1 = nvstrings.to_device(["a","b","c","a"])
+      s2 = nvstrings.to_device(["a","c","a"])
+      print(nvstrings.join_indices(s1,s2))
+      print(nvstrings.join_indices(s1,s2,'anti'))
+
+    Output:
+
+    .. code-block:: python
+
+      (array([0, 0, 2, 3, 3]), array([0, 2, 1, 0, 2]))
+      [1]
+
+    """
+    if how not in ('inner', 'left', 'semi', 'anti'):
+        raise ValueError("how must be 'inner', 'left', 'semi' or 'anti'")
+    if right.size() <= left.size():
+        lidx, ridx = _probe(_hash_index(right), right, left)
+    else:
+        ridx, lidx = _probe(_hash_index(left), left, right)
+    lidx = lidx.astype(np.int64)
+    ridx = ridx.astype(np.int64)
+    if how in ('semi', 'anti'):
+        matched = np.zeros(left.size(), dtype=np.bool_)
+        matched[lidx] = True
+        return np.flatnonzero(matched if how == 'semi' else ~matched)
+    if how == 'left':
+        unmatched = np.ones(left.size(), dtype=np.bool_)
+        unmatched[lidx] = False
+        unmatched = np.flatnonzero(unmatched)
+        lidx = np.concatenate([lidx, unmatched])
+        ridx = np.concatenate([ridx, np.full(len(unmatched), -1)])
+    order = np.lexsort((ridx, lidx))
+    return lidx[order], ridx[order]
+
+
+# longest string in bytes accepted by the number parsers
+_NUMBER_WIDTH = 64
+
+# float syntax: [+-] digits [. digits] [(e|E) [+-] digits]
+# states: 0 start, 1 sign, 2 integer, 3 leading dot, 4 fraction,
+# 5 exponent, 6 exponent sign, 7 exponent digits, 8 trailing dot,
+# 9 invalid; classes: digit, sign, dot, exponent, other
+_FLOAT_STATES = np.array([[2, 1, 3, 9, 9],
+                          [2, 9, 3, 9, 9],
+                          [2, 9, 8, 5, 9],
+                          [4, 9, 9, 9, 9],
+                          [4, 9, 9, 5, 9],
+                          [7, 6, 9, 9, 9],
+                          [7, 9, 9, 9, 9],
+                          [7, 9, 9, 9, 9],
+                          [4, 9, 9, 5, 9],
+                          [9, 9, 9, 9, 9]], dtype=np.int8)
+_FLOAT_FINAL = [2, 4, 7, 8]
+_FLOAT_SPECIAL = [b'inf', b'+inf', b'-inf', b'infinity', b'+infinity',
+                  b'-infinity', b'nan', b'+nan', b'-nan']
+
+
+def _parse_int_rows(chars, nbytes, base):
+    """
+    Return the magnitude, sign, syntax and overflow flags of the
+    integers in the rows of a byte matrix.
+    """
+    # two extra columns so the hex prefix can always be checked
+    chars = np.pad(chars, ((0, 0), (0, 2)))
+    negative = chars[:, 0] == ord('-')
+    start = (negative | (chars[:, 0] == ord('+'))).astype(np.int64)
+    rows = np.arange(len(chars))
+    if base == 16:
+        prefix = (chars[rows, start] == ord('0')) & \
+            ((chars[rows, start + 1] | 0x20) == ord('x'))
+        start += 2 * prefix
+    digits = np.where((chars >= ord('0')) & (chars <= ord('9')),
+                      chars - ord('0'), 255)
+    if base == 16:
+        lower = chars | 0x20
+        digits = np.where((lower >= ord('a')) & (lower <= ord('f')),
+                          lower - ord('a') + 10, digits)
+    cols = np.arange(chars.shape[1])
+    active = (cols >= start[:, None]) & (cols < nbytes[:, None])
+    valid = (nbytes > start) & (nbytes <= _NUMBER_WIDTH) & \
+        ~(active & (digits >= base)).any(axis=1)
+    active &= valid[:, None]
+    value = np.zeros(len(chars), dtype=np.uint64)
+    overflow = np.zeros(len(chars), dtype=np.bool_)
+    maximum = np.uint64(np.iinfo(np.uint64).max)
+    base = np.uint64(base)
+    for col in cols:
+        digit = digits[:, col].astype(np.uint64)
+        overflow |= active[:, col] & (value > (maximum - digit) // base)
+        value = np.where(active[:, col], value * base + digit, value)
+    return value, negative, valid, overflow
+
+
+def _parse_float_rows(strs, chars, nbytes):
+    """Return the float syntax flag of the rows of a byte matrix."""
+    classes = np.full(chars.shape, 4, dtype=np.int8)
+    classes[(chars >= ord('0')) & (chars <= ord('9'))] = 0
+    classes[(chars == ord('+')) | (chars == ord('-'))] = 1
+    classes[chars == ord('.')] = 2
+    classes[(chars | 0x20) == ord('e')] = 3
+    state = np.zeros(len(chars), dtype=np.int8)
+    for col in range(chars.shape[1]):
+        state = np.where(col < nbytes,
+                         _FLOAT_STATES[state, classes[:, col]], state)
+    valid = np.isin(state, _FLOAT_FINAL)
+    valid |= np.isin(np.char.lower(strs), _FLOAT_SPECIAL)
+    valid &= (nbytes > 0) & (nbytes <= _NUMBER_WIDTH)
+    return valid
+
+
+# width of each strftime-style directive; 0 is variable (1 to 9 digits)
+_TIME_FIELDS = {'Y': 4, 'm': 2, 'd': 2, 'H': 2, 'M': 2, 'S': 2, 'f': 0}
+_TIME_UNITS = {'s': 1, 'ms': 1000, 'us': 1000000, 'ns': 1000000000}
+
+
+def _compile_time_format(format):
+    """
+    Return the format as a list of (directive, width) fields and
+    (None, bytes) literals.
+    """
+    rtn = []
+    i = 0
+    while i < len(format):
+        if format[i] != '%':
+            item = (None, format[i].encode('utf-8'))
+        elif format[i + 1:i + 2] == '%':
+            item = (None, b'%')
+        elif format[i + 1:i + 2] in _TIME_FIELDS:
+            item = (format[i + 1], _TIME_FIELDS[format[i + 1]])
+        else:
+            raise ValueError("unsupported format " + format[i:i + 2])
+        i += 1 if format[i] != '%' else 2
+        if item[0] is None and rtn and rtn[-1][0] is None:
+            item = (None, rtn.pop()[1] + item[1])
+        rtn.append(item)
+    return rtn
+
+
+def _days_from_civil(year, month, day):
+    """Return the days since 1970-01-01 of each proleptic date."""
+    year = year - (month <= 2)
+    era = year // 400
+    yoe = year - era * 400
+    doy = (153 * np.where(month > 2, month - 3, month + 9) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+
+def _civil_from_days(days):
+    """Return the proleptic year, month and day of each day number."""
+    days = days + 719468
+    era = days // 146097
+    doe = days - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = np.where(mp < 10, mp + 3, mp - 9)
+    return yoe + era * 400 + (month <= 2), month, day
+
+
+def from_timestamp(values, format='%Y-%m-%dT%H:%M:%S', unit='s'):
+    """
+    Create nvstrings instance from timestamp values.
+
+    Parameters
+    ----------
+        values : numpy array
+            Integer times since 1970-01-01 00:00:00 in the given unit.
+        format : str
+            Output format using %Y, %m, %d, %H, %M, %S and %f.
+            The %f fraction has 3 digits for 'ms', 9 for 'ns' and
+            6 otherwise.
+        unit : str
+            Resolution of the values: 's', 'ms', 'us' or 'ns'.
+
+    Returns
+    -------
+    A new nvstrings instance
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+      import nvstrings
+      import numpy as np
+      values = np.array([0, 1546300800123])
+      print(nvstrings.from_timestamp(values, '%Y-%m-%d %H:%M:%S.%f', 'ms'))
+
+    Output:
+
+    .. code-block:: python
+
+      ['1970-01-01 00:00:00.000', '2019-01-01 00:00:00.123']
+
+    """
+    if unit not in _TIME_UNITS:
+        raise ValueError("unit must be 's', 'ms', 'us' or 'ns'")
+    scale = _TIME_UNITS[unit]
+    values = np.asarray(values, dtype=np.int64)
+    seconds = values // scale
+    days = seconds // 86400
+    seconds = seconds - days * 86400
+    year, month, day = _civil_from_days(days)
+    fields = {'Y': (year, 4), 'm': (month, 2), 'd': (day, 2),
+              'H': (seconds // 3600, 2), 'M': (seconds // 60 % 60, 2),
+              'S': (seconds % 60, 2),
+              'f': (values % scale * 1000000 // scale, 6)}
+    if unit in ('ms', 'ns'):
+        fields['f'] = (values % scale, len(str(scale)) - 1)
+    rtn = np.full(len(values), '', dtype=object)
+    for field, item in _compile_time_format(format):
+        if field is None:
+            rtn = rtn + item.decode('utf-8')
+        else:
+            value, width = fields[field]
+            rtn = rtn + np.char.zfill(value.astype(str), width).astype(object)
+    return to_device(rtn.tolist())
+
+
+def int_to_ip(values):
+    """
+    Create nvstrings instance of IPv4 addresses from integer values.
+
+    Parameters
+    ----------
+        values : numpy array
+            Addresses as unsigned 32-bit values.
+
+    Returns
+    -------
+    A new nvstrings instance
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+      import nvstrings
+      import numpy as np
+      print(nvstrings.int_to_ip(np.array([3232235521, 167772162])))
+
+    Output:
+
+    .. code-block:: python
+
+      ['192.168.0.1', '10.0.0.2']
+
+    """
+    values = np.asarray(values).astype(np.uint32)
+    rtn = np.full(len(values), '', dtype=object)
+    for shift in (24, 16, 8, 0):
+        octet = (values >> np.uint32(shift)) & np.uint32(255)
+        rtn = rtn + octet.astype(str).astype(object)
+        if shift:
+            rtn = rtn + '.'
+    return to_device(rtn.tolist())
+
+
+def _read_le(chars, pos, nbytes, dtype):
+    """
+    Return the little-endian integers of nbytes bytes at pos.
+    Positions past the end of chars read the last byte.
+    """
+    rtn = np.zeros(len(pos), dtype=dtype)
+    for i in range(nbytes):
+        byte = chars[np.minimum(pos + i, len(chars) - 1)]
+        rtn |= byte.astype(dtype) << dtype(8 * i)
+    return rtn
+
+
+def _rotl(value, bits, dtype):
+    """Rotate each unsigned value left by bits."""
+    size = dtype(8 * np.dtype(dtype).itemsize)
+    return (value << dtype(bits)) | (value >> (size - dtype(bits)))
+
+
+def _active_rows(sizes, count):
+    """
+    Return how many of the sizes, in decreasing order, are greater
+    than each of 0 to count-1.
+    """
+    return np.searchsorted(-sizes, -np.arange(count), 'left').tolist()
+
+
+def _hash_rows(algorithm, chars, offsets, lengths, seed):
+    """
+    Return the hash of each string. The kernels receive the strings
+    ordered by decreasing length so each block position only touches
+    the leading rows that are long enough to contain it.
+    """
+    order = np.argsort(-lengths, kind='stable')
+    hashes = _HASHES[algorithm](chars, offsets[:-1][order], lengths[order],
+                                seed)
+    rtn = np.empty_like(hashes)
+    rtn[order] = hashes
+    return rtn
+
+
+def _murmur3_32(chars, starts, lengths, seed):
+    """Return the MurmurHash3 x86 32-bit hash of each string."""
+    u32 = np.uint32
+    c1 = u32(0xcc9e2d51)
+    c2 = u32(0x1b873593)
+
+    def mix(k):
+        return _rotl(k * c1, 15, u32) * c2
+
+    h = np.full(len(lengths), seed, dtype=u32)
+    nblocks = lengths // 4
+    count = int(nblocks.max(initial=0))
+    for i, rows in enumerate(_active_rows(nblocks, count)):
+        k = _read_le(chars, starts[:rows] + 4 * i, 4, u32)
+        hr = _rotl(h[:rows] ^ mix(k), 13, u32)
+        h[:rows] = hr * u32(5) + u32(0xe6546b64)
+    tail = lengths % 4
+    pos = starts + 4 * nblocks
+    k = np.zeros(len(lengths), dtype=u32)
+    for i in range(3):
+        byte = _read_le(chars, pos + i, 1, u32) << u32(8 * i)
+        k |= np.where(tail > i, byte, u32(0))
+    h ^= np.where(tail > 0, mix(k), u32(0))
+    h ^= lengths.astype(u32)
+    h ^= h >> u32(16)
+    h *= u32(0x85ebca6b)
+    h ^= h >> u32(13)
+    h *= u32(0xc2b2ae35)
+    h ^= h >> u32(16)
+    return h
+
+
+def _xxhash64(chars, starts, lengths, seed):
+    """Return the xxHash 64-bit hash of each string."""
+    u64 = np.uint64
+    p1 = u64(11400714785074694791)
+    p2 = u64(14029467366897019727)
+    p3 = u64(1609587929392839161)
+    p4 = u64(9650029242287828579)
+    p5 = u64(2870177450012600261)
+    # arrays rather than scalars so the arithmetic wraps silently
+    seed = np.full(1, seed, dtype=u64)
+
+    def accumulate(acc, lane):
+        return _rotl(acc + lane * p2, 31, u64) * p1
+
+    count = len(lengths)
+    h = np.repeat(seed + p5, count)
+    nstripes = lengths // 32
+    nrows = np.count_nonzero(nstripes)
+    if nrows:
+        acc = [np.repeat(v, nrows)
+               for v in (seed + p1 + p2, seed + p2, seed, seed - p1)]
+        for i, rows in enumerate(_active_rows(nstripes, nstripes[0])):
+            pos = starts[:rows] + 32 * i
+            for j in range(4):
+                lane = _read_le(chars, pos + 8 * j, 8, u64)
+                acc[j][:rows] = accumulate(acc[j][:rows], lane)
+        hr = _rotl(acc[0], 1, u64) + _rotl(acc[1], 7, u64) + \
+            _rotl(acc[2], 12, u64) + _rotl(acc[3], 18, u64)
+        for j in range(4):
+            hr = (hr ^ accumulate(u64(0), acc[j])) * p1 + p4
+        h[:nrows] = hr
+    h += lengths.astype(u64)
+    pos = starts + 32 * nstripes
+    remain = lengths % 32
+    for i in range(3):
+        active = remain >= 8 * (i + 1)
+        lane = accumulate(u64(0), _read_le(chars, pos + 8 * i, 8, u64))
+        h = np.where(active, _rotl(h ^ lane, 27, u64) * p1 + p4, h)
+    pos += 8 * (remain // 8)
+    remain %= 8
+    word = _read_le(chars, pos, 4, u64) * p1
+    h = np.where(remain >= 4, _rotl(h ^ word, 23, u64) * p2 + p3, h)
+    pos += 4 * (remain >= 4)
+    remain %= 4
+    for i in range(3):
+        byte = _read_le(chars, pos + i, 1, u64) * p5
+        h = np.where(remain > i, _rotl(h ^ byte, 11, u64) * p1, h)
+    h ^= h >> u64(33)
+    h *= p2
+    h ^= h >> u64(29)
+    h *= p3
+    h ^= h >> u64(32)
+    return h
+
+
+def _fnv1a64(chars, starts, lengths, seed):
+    """Return the FNV-1a 64-bit hash of each string."""
+    u64 = np.uint64
+    h = np.full(len(lengths), u64(0xcbf29ce484222325) ^ u64(seed),
+                dtype=u64)
+    count = int(lengths.max(initial=0))
+    for i, rows in enumerate(_active_rows(lengths, count)):
+        hr = h[:rows] ^ chars[starts[:rows] + i].astype(u64)
+        h[:rows] = hr * u64(0x100000001b3)
+    return h
+
+
+_HASHES = {'murmur3_32': _murmur3_32, 'xxhash64': _xxhash64,
+           'fnv1a64': _fnv1a64}
+
+
+# order(k=) sorts all the strings instead when more than
+# size() // _SELECT_MAX_TIES of them have the same sort key as the k-th
+_SELECT_MAX_TIES = 8
+
+
+# this will be documented with all the public methods
+class nvstrings:
+    """
+    Instance manages a list of strings in device memory.
+
+    Operations are across all of the strings and their results reside in
+    device memory. Strings in the list are immutable.
+    Methods that modify any string will create a new nvstrings instance.
+    """
+    #
+    m_cptr = 0
+
+    def __init__(self, cptr):
+        """
+        Use to_device() to create new instance from Python array of strings.
+        """
+        self.m_cptr = cptr
+        self._sort_keys = None
+        # process id and shared memory segment used by parallel()
+        self._segment = None
+
+    def __del__(self):
+        if self._segment is not None and self._segment[0] == os.getpid():
+            self._segment[1].close()
+            self._segment[1].unlink()
+        pyniNVStrings.n_destroyStrings(self.m_cptr)
+        self.m_cptr = 0
+
+    def __str__(self):
+        return str(pyniNVStrings.n_createHostStrings(self.m_cptr))
+
+    def __repr__(self):
+        return "<nvstrings count={}>".format(self.size())
+
+    def __reduce_ex__(self, protocol):
+        """
+        Pickle the UTF-8 characters, offsets and null bit-array.
+        With protocol 5 or later the buffers are passed as PickleBuffer
+        objects so they can be transferred out-of-band without copies.
+        """
+        chars, offsets, valid = self._host_buffers()
+        if offsets[-1] <= np.iinfo(np.int32).max:
+            offsets = offsets.astype(np.int32)
+        dtype = offsets.dtype.str
+        nulls = None
+        if not valid.all():
+            nulls = np.packbits(valid, bitorder='little')
+        buffers = [chars, offsets, nulls]
+        for i, buffer in enumerate(buffers):
+            if buffer is None:
+                continue
+            if protocol >= 5:
+                buffers[i] = pickle.PickleBuffer(buffer)
+            else:
+                buffers[i] = buffer.tobytes()
+        chars, offsets, nulls = buffers
+        return _from_buffers, (chars, offsets, dtype, nulls)
+
+    def _shared_arrays(self):
+        """Return the arrays placed in shared memory by this instance."""
+        chars, offsets, valid = self._host_buffers()
+        return [chars, offsets, np.packbits(valid, bitorder='little')]
+
+    def to_shared_memory(self, name=None):
+        """
+        Copy the UTF-8 characters, offsets and null bit-array of this
+        instance into a new shared memory segment. Other processes can
+        create an instance from it using from_shared_memory().
+
+        The caller owns the segment and must call close() on the
+        returned object when done and unlink() once no other process
+        needs to attach to it.
+
+        Parameters
+        ----------
+          name : str
+            Name of the shared memory segment.
+            A unique name is generated if one is not specified.
+
+        Returns
+        -------
+          multiprocessing.shared_memory.SharedMemory: the new segment
+
+        Examples
+        --------
+        .. code-block:: python
+
+          import nvstrings
+
+          s = nvstrings.to_device(["hello", "world"])
+          shm = s.to_shared_memory("words")
+          print(shm.name)
+          shm.close()
+          shm.unlink()
+
+        Output:
+
+        .. code-block:: python
+
+          words
+
+        """
+        return _to_shared_memory(name, self._shared_arrays())
+
+    def parallel(self, fn_name, *args, **kwargs):
+        """
+        Call an element-wise method over chunks of rows using the
+        executor specified with set_executor() and return the results
+        concatenated in row order.
+        Without an executor, or when there are too few rows to split,
+        the method is simply called on this instance.
+
+        The rows are copied into a shared memory segment by the first
+        call, which later calls on this instance reuse. The segment is
+        unlinked when this instance is deleted. Workers return string
+        results as UTF-8 buffers that are joined into a single new
+        instance. Copying the rows and the results between host and
+        device memory still runs in the calling process, so only
+        methods that do much more work than that per string benefit.
+
+        Parameters
+        ----------
+          fn_name : str
+            Name of the nvstrings method to call, for example 'lower',
+            'replace', 'contains', 'extract' or 'stoi'.
+            Methods whose results depend on other rows are not allowed.
+
+          args, kwargs :
+            Arguments for the method. They must be picklable when the
+            executor uses processes. Device memory pointers are not
+            supported.
+
+        Examples
+        --------
+        .. code-block:: python
+
+          import nvstrings
+
+          s = nvstrings.to_device(["hello", "goodbye"])
+          print(s.parallel('replace', 'o', '0'))
+
+        Output:
+
+        .. code-block:: python
+
+          ['hell0', 'g00dbye']
+
+        """
+        if fn_name not in _PARALLEL_METHODS:
+            raise ValueError("{} cannot be run in parallel".format(fn_name))
+        count = self.size()
+        nchunks = 1
+        if _executor is not None:
+            nchunks = min(_executor_workers, count // _PARALLEL_MIN_ROWS)
+        if nchunks <= 1:
+            return getattr(self, fn_name)(*args, **kwargs)
+        bounds = np.linspace(0, count, nchunks + 1).astype(np.int64)
+        if self._segment is None:
+            self._segment = (os.getpid(), self.to_shared_memory())
+        name = self._segment[1].name
+        futures = [_executor.submit(_run_chunk, name, int(start), int(stop),
+                                    fn_name, args, kwargs)
+                   for start, stop in zip(bounds[:-1], bounds[1:])]
+        results = [future.result() for future in futures]
+        return _concat_results(results, fn_name in _PARALLEL_COLUMNS)
+
+    def to_host(self):
+        """
+        Copies strings back to CPU memory into a Python array.
+
+        Returns
+        -------
+        A list of strings
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+          import nvstrings
+          s = nvstrings.to_device(["hello","world"])
+
+          h = s.upper().to_host()
+          print(h)
+
+        Output:
+
+        .. code-block:: python
+
+          ["HELLO","WORLD"]
+
+        """
+        return pyniNVStrings.n_createHostStrings(self.m_cptr)
+
+    def size(self):
+        """
+        The number of strings managed by this instance.
+
+        Returns
+        -------
+          int: number of strings
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+          import nvstrings
+          s = nvstrings.to_device(["hello","world"])
+          print(s.size())
+
+        Output:
+
+        .. code-block:: python
+
+          2
+
+        """
+        return pyniNVStrings.n_size(self.m_cptr)
+
+    def len(self, devptr=0):
+        """
+        Returns the number of characters of each string.
+
+        Parameters
+        ----------
+            devptr : GPU memory pointer
+                Where string length values will be written.
+                Must be able to hold at least size() of int32 values.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+          import nvstrings
+          import numpy as np
+          from librmm_cffi import librmm
+
+          # example passing device memory pointer
+          s = nvstrings.to_device(["abc","d","ef"])
+          arr = np.arange(s.size(),dtype=np.int32)
+          d_arr = librmm.to_device(arr)
+          s.len(d_arr.device_ctypes_pointer.value)
+          print(d_arr.copy_to_host())
+
+        Output:
+
+        .. code-block:: python
+
+          [3,1,2]
+
+        """
+        rtn = pyniNVStrings.n_len(self.m_cptr, devptr)
+        return rtn
+
+    def compare(self, str, devptr=0):
+        """
+        Compare each string to the supplied string.
+        Returns value of 0 for strings that match str.
+        Returns < 0 when first different character is lower
+        than argument string or argument string is shorter.
+        Returns > 0 when first different character is greater
+        than the argument string or the argument string is longer.
+
+        Parameters
+        ----------
+            str : str
+                String to compare all strings in this instance.
+
+            devptr : GPU memory pointer
+                Where string result values will be written.
+                Must be able to hold at least size() of int32 values.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+          import nvstrings
+          s = nvstrings.to_device(["hello","world"])
+
+          print(s.compare('hello'))
+
+        Output:
+
+        .. code-block:: python
+
+          [0,15]
+
+        """
+        rtn = pyniNVStrings.n_compare(self.m_cptr, str, devptr)
+        return rtn
+
+    def hash(self, devptr=0, algorithm=None, seed=0, dtype=None):
+        """
+        Returns hash values represented by each string.
+
+        Parameters
+        ----------
+            devptr : GPU memory pointer
+                Where string hash values will be written.
+                Must be able to hold at least size() of uint32 values.
+                Only used when algorithm is not specified.
+
+            algorithm : str
+                If specified, one of the following algorithms is
+                applied to the UTF-8 bytes of each string and a numpy
+                array is returned. Null strings hash to 0.
+
+                'murmur3_32' is MurmurHash3 x86 32-bit (uint32).
+
+                'xxhash64' is xxHash 64-bit (uint64).
+
+                'fnv1a64' is FNV-1a 64-bit (uint64) with the offset
+                basis exclusive-or'd with the seed.
+
+                These match the reference implementations so the
+                values are stable across processes and releases.
+
+            seed : int
+                Seed value for the algorithm. It is reduced to the
+                width of the algorithm (seed & 0xffffffff for
+                'murmur3_32' and seed & 0xffffffffffffffff otherwise)
+                so negative seeds, such as signed 32-bit seeds used by
+                JVM implementations, give the same hash values.
+
+            dtype : numpy.dtype
+                Type of the returned values. A signed type of the same
+                size reinterprets the bits of the hash values.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+          import nvstrings
+          s = nvstrings.to_device(["hello","world"])
+          print(s.hash())
+          print(s.hash(algorithm='murmur3_32'))
+          print(s.hash(algorithm='xxhash64', dtype='int64'))
+
+        Output:
+
+        .. code-block:: python
+
+          [99162322, 113318802]
+          [ 613153351 4220927227]
+          [ 2794345569481354659 -1767385783675760145]
+
+        """
+        if algorithm is None:
+            rtn = pyniNVStrings.n_hash(self.m_cptr, devptr)
+            return rtn
+        if algorithm not in _HASHES:
+            raise ValueError("algorithm must be one of " +
+                             ", ".join(sorted(_HASHES)))
+        bits = 32 if algorithm == 'murmur3_32' else 64
+        seed = int(seed) & ((1 << bits) - 1)
+        chars, offsets, valid = self._host_buffers()
+        lengths = np.diff(offsets)
+        # a trailing byte keeps the clipped reads in range when empty
+        chars = np.concatenate([chars, np.zeros(1, dtype=np.uint8)])
+
+        def kernel(start, stop):
+            return _hash_rows(algorithm, chars, offsets[start:stop + 1],
+                              lengths[start:stop], seed)
+
+        rtn = _map_chunks(kernel, len(lengths))
+        rtn[~valid] = 0
+        if dtype is not None:
+            dtype = np.dtype(dtype)
+            if dtype.itemsize == rtn.dtype.itemsize:
+                rtn = rtn.view(dtype)
+            else:
+                rtn = rtn.astype(dtype)
+        return rtn
+
+    def partition_by_hash(self, nparts, seed=0, others=None):
+        """
+        Reorder the strings so strings with the same hash bucket are
+        adjacent. The bucket of each string is its murmur3_32 hash
+        modulo nparts and null strings are placed in bucket 0.
+        Strings keep their relative order within each bucket and all
+        buckets are gathered with a single sublist() call.
+
+        Parameters
+        ----------
+          nparts : int
+            Number of buckets.
+
+          seed : int
+            Seed value for the hash. Only its low 32 bits are used
+            as described in hash().
+
+          others : list
+            Companion columns of nvstrings instances or numpy arrays
+            with size() rows to reorder the same way.
+
+        Returns
+        -------
+          tuple: the reordered nvstrings and a numpy int64 array of
+          nparts+1 offsets where bucket i is the range
+          [offsets[i], offsets[i+1]). If others is specified, a list
+          of the reordered companion columns is also returned.
+
+        Examples
+        --------
+        .. code-block:: python
+
+          import nvstrings
+
+          s = nvstrings.to_device(["a", "b", "c", "a", "d"])
+          strs, offsets = s.partition_by_hash(2)
+          print(strs)
+          print(offsets)
+
+        Output:
+
+        .. code-block:: python
+
+          ['a', 'a', 'b', 'c', 'd']
+          [0 2 5]
+
+        """
+        if nparts < 1:
+            raise ValueError("nparts must be at least 1")
+        count = self.size()
+        if others is not None:
+            for other in others:
+                size = other.size() if isinstance(other, nvstrings) \
+                    else len(other)
+                if size != count:
+                    raise ValueError("others must have {} rows".format(
+                        count))
+        parts = self.hash(algorithm='murmur3_32', seed=seed) % nparts
+        # small integer keys let the stable sort use a radix sort
+        if nparts <= 0x10000:
+            parts = parts.astype(np.uint16)
+        rows = np.argsort(parts, kind='stable')
+        offsets = np.zeros(nparts + 1, dtype=np.int64)
+        np.cumsum(np.bincount(parts, minlength=nparts), out=offsets[1:])
+        rtn = self.sublist(rows.tolist())
+        if others is None:
+            return rtn, offsets
+        columns = []
+        for other in others:
+            if isinstance(other, nvstrings):
+                columns.append(other.sublist(rows.tolist()))
+            else:
+                columns.append(np.asarray(other)[rows])
+        return rtn, offsets, columns
+
+    def stoi(self, devptr=0):
+        """
+        Returns integer value represented by each string.
+
+        Parameters
+        ----------
+            devptr : GPU memory pointer
+                Where resulting integer values will be written.
+                Memory must be able to hold at least size() of int32 values.
+
+        Examples
+        --------
+        .. code-block:: python
+
+          import nvstrings
+          import numpy as np
+          s = nvstrings.to_device(["1234","-876","543.2","-0.12",".55""])
+          print(s.stoi())
+
+        Output:
+
+        .. code-block:: python
+
+          [1234, -876, 543, 0, 0]
+
+        """
+        rtn = pyniNVStrings.n_stoi(self.m_cptr, devptr)
+        return rtn
+
+    def stof(self, devptr=0):
+        """
+        Returns float values represented by each string.
+
+        Parameters
+        ----------
+            devptr : GPU memory pointer
+                Where resulting float values will be written.
+                Memory must be able to hold at least size() of float32 values
+
+        Examples
+        --------
+        .. code-block:: python
+
+          import nvstrings
+          import numpy as np
+          from librmm_cffi import librmm
+          s = nvstrings.to_device(["1234","-876","543.2","-0.12",".55"])
+          print(s.stof())
+
+        Output:
+
+        .. code-block:: python
+
+          [1234.0, -876.0, 543.2000122070312,
+           -0.11999999731779099, 0.550000011920929]
+
+        """
+        rtn = pyniNVStrings.n_stof(self.m_cptr, devptr)
+        return rtn
+
+    def _host_buffers(self):
+        """
+        Return the UTF-8 characters of all the strings, the offsets
+        of each string and a bool array which is False for nulls.
+        """
+        strs = self.to_host()
+        valid = np.ones(len(strs), dtype=np.bool_)
+        if None in strs:
+            valid[:] = [str is not None for str in strs]
+            strs = [str or '' for str in strs]
+        chars, lengths = _encode_strings(strs)
+        offsets = np.zeros(len(strs) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return chars, offsets, valid
+
+    def _byte_matrix(self, width):
+        """
+        Return the UTF-8 bytes of each string as a fixed width numpy
+        bytes array and as a uint8 matrix along with the byte count
+        of each string (-1 for nulls). Strings longer than width are
+        truncated but their full byte count is returned.
+        """
+        strs = self.to_host()
+        nbytes = np.full(len(strs), -1, dtype=np.int64)
+        for i, str in enumerate(strs):
+            strs[i] = b'' if str is None else str.encode('utf-8')
+            if str is not None:
+                nbytes[i] = len(strs[i])
+        size = max(1, min(width, int(nbytes.max(initial=0))))
+        rtn = np.array([b[:size] for b in strs], dtype='S{}'.format(size))
+        return rtn, rtn.view(np.uint8).reshape(len(strs), size), nbytes
+
+    def _parse_int(self, base):
+        """
+        Return the magnitude, sign, syntax and overflow flags of the
+        integer represented by each string.
+        """
+        if base not in (10, 16):
+            raise ValueError("base must be 10 or 16")
+        strs, chars, nbytes = self._byte_matrix(_NUMBER_WIDTH)
+
+        def kernel(start, stop):
+            return _parse_int_rows(chars[start:stop], nbytes[start:stop],
+                                   base)
+
+        return _map_chunks(kernel, len(chars))
+
+    def to_int(self, dtype=np.int64, base=10):
+        """
+        Returns integer values represented by each string along with
+        a validity mask.
+
+        Each string must contain only an optional sign followed by
+        digits. For base 16 an optional 0x prefix is accepted.
+        Strings that are null, malformed or out of range for dtype
+        are invalid and their value is 0.
+
+        Parameters
+        ----------
+            dtype : numpy.dtype
+                Integer type of the results.
 
-    def to_host(self):
-        """
-        Copies strings back to CPU memory into a Python array.
+            base : int
+                Either 10 or 16.
 
         Returns
         -------
-        A list of strings
+        Tuple of the numpy array of values and numpy bool array which
+        is True for each string that was converted.
 
         Examples
         --------
-
         .. code-block:: python
 
           import nvstrings
-          s = nvstrings.to_device(["hello","world"])
-
-          h = s.upper().to_host()
-          print(h)
+          s = nvstrings.to_device(["1234","-9000000000","1.5",None])
+          values, valid = s.to_int()
+          print(values)
+          print(valid)
+          print(nvstrings.to_device(["ff","0x10"]).to_int(base=16)[0])
 
         Output:
 
         .. code-block:: python
 
-          ["HELLO","WORLD"]
-
-        """
-        return pyniNVStrings.n_createHostStrings(self.m_cptr)
-
-    def size(self):
-        """
-        The number of strings managed by this instance.
-
-        Returns
-        -------
-          int: number of strings
+          [       1234 -9000000000           0           0]
+          [ True  True False False]
+          [255  16]
+
+        """
+        dtype = np.dtype(dtype)
+        if dtype.kind not in 'iu':
+            raise ValueError("dtype must be an integer type")
+        value, negative, valid, overflow = self._parse_int(base)
+        info = np.iinfo(dtype)
+        valid &= ~overflow
+        if dtype.kind == 'u':
+            valid &= ~negative | (value == 0)
+            valid &= value <= np.uint64(info.max)
+        else:
+            valid &= np.where(negative, value <= np.uint64(-info.min),
+                              value <= np.uint64(info.max))
+            value = np.where(negative, np.uint64(0) - value, value)
+            value = value.view(np.int64)
+        rtn = np.where(valid, value, 0).astype(dtype)
+        return rtn, valid
+
+    def is_integer(self, base=10):
+        """
+        Return array of boolean values with True for strings that
+        represent an integer as accepted by to_int().
+        Values that do not fit in 64 bits return False.
 
         Examples
         --------
-
         .. code-block:: python
 
           import nvstrings
-          s = nvstrings.to_device(["hello","world"])
-          print(s.size())
+          s = nvstrings.to_device(["1234","-12","1.5","", "+7"])
+          print(s.is_integer())
 
         Output:
 
         .. code-block:: python
 
-          2
+          [ True  True False False  True]
 
         """
-        return pyniNVStrings.n_size(self.m_cptr)
+        value, negative, valid, overflow = self._parse_int(base)
+        return valid & ~overflow
 
-    def len(self, devptr=0):
+    def _parse_float(self):
+        """Return the bytes of each string and its float syntax flag."""
+        strs, chars, nbytes = self._byte_matrix(_NUMBER_WIDTH)
+
+        def kernel(start, stop):
+            return _parse_float_rows(strs[start:stop], chars[start:stop],
+                                     nbytes[start:stop])
+
+        return strs, _map_chunks(kernel, len(strs))
+
+    def to_float(self, dtype=np.float64):
         """
-        Returns the number of characters of each string.
+        Returns float values represented by each string along with
+        a validity mask.
+
+        Each string must contain only an optional sign, digits with an
+        optional decimal point and an optional exponent, or one of
+        inf, infinity or nan. Strings that are null or malformed are
+        invalid and their value is 0.
 
         Parameters
         ----------
-            devptr : GPU memory pointer
-                Where string length values will be written.
-                Must be able to hold at least size() of int32 values.
+            dtype : numpy.dtype
+                Floating point type of the results.
+
+        Returns
+        -------
+        Tuple of the numpy array of values and numpy bool array which
+        is True for each string that was converted.
 
         Examples
         --------
-
         .. code-block:: python
 
           import nvstrings
-          import numpy as np
-          from librmm_cffi import librmm
-
-          # example passing device memory pointer
-          s = nvstrings.to_device(["abc","d","ef"])
-          arr = np.arange(s.size(),dtype=np.int32)
-          d_arr = librmm.to_device(arr)
-          s.len(d_arr.device_ctypes_pointer.value)
-          print(d_arr.copy_to_host())
+          s = nvstrings.to_device(["1234","-0.12","1e-3","1.2.3",None])
+          values, valid = s.to_float()
+          print(values)
+          print(valid)
 
         Output:
 
         .. code-block:: python
 
-          [3,1,2]
+          [ 1.234e+03 -1.200e-01  1.000e-03  0.000e+00  0.000e+00]
+          [ True  True  True False False]
 
         """
-        rtn = pyniNVStrings.n_len(self.m_cptr, devptr)
-        return rtn
+        dtype = np.dtype(dtype)
+        if dtype.kind != 'f':
+            raise ValueError("dtype must be a floating point type")
+        strs, valid = self._parse_float()
+        rtn = np.zeros(len(strs), dtype=dtype)
+        rtn[valid] = strs[valid].astype(dtype)
+        return rtn, valid
 
-    def compare(self, str, devptr=0):
+    def is_float(self):
         """
-        Compare each string to the supplied string.
-        Returns value of 0 for strings that match str.
-        Returns < 0 when first different character is lower
-        than argument string or argument string is shorter.
-        Returns > 0 when first different character is greater
-        than the argument string or the argument string is longer.
-
-        Parameters
-        ----------
-            str : str
-                String to compare all strings in this instance.
-
-            devptr : GPU memory pointer
-                Where string result values will be written.
-                Must be able to hold at least size() of int32 values.
+        Return array of boolean values with True for strings that
+        represent a float as accepted by to_float().
 
         Examples
         --------
-
         .. code-block:: python
 
           import nvstrings
-          s = nvstrings.to_device(["hello","world"])
-
-          print(s.compare('hello'))
+          s = nvstrings.to_device(["1234","-.5","1e10","e5","nan"])
+          print(s.is_float())
 
         Output:
 
         .. code-block:: python
 
-          [0,15]
+          [ True  True  True False  True]
 
         """
-        rtn = pyniNVStrings.n_compare(self.m_cptr, str, devptr)
-        return rtn
+        return self._parse_float()[1]
 
-    def hash(self, devptr=0):
+    def to_timestamp(self, format='%Y-%m-%dT%H:%M:%S.%f', unit='ms'):
         """
-        Returns hash values represented by each string.
+        Returns timestamp values represented by each string along with
+        a validity mask.
+
+        The format is compiled once and applied to all strings.
+        Formats with only fixed width fields read each field from the
+        same position of every string.
 
         Parameters
         ----------
-            devptr : GPU memory pointer
-                Where string hash values will be written.
-                Must be able to hold at least size() of uint32 values.
+            format : str
+                Format of the strings using %Y (4 digits), %m, %d, %H,
+                %M, %S (2 digits each) and %f (1 to 9 fractional digits).
+                Other characters must match exactly.
+
+            unit : str
+                Resolution of the results: 's', 'ms', 'us' or 'ns'.
+
+        Returns
+        -------
+        Tuple of the numpy int64 array of times since 1970-01-01 00:00:00
+        in the given unit and numpy bool array which is True for each
+        string that was converted.
 
         Examples
         --------
-
         .. code-block:: python
 
           import nvstrings
-          s = nvstrings.to_device(["hello","world"])
-          s.hash()
+          s = nvstrings.to_device(["2019-01-01T00:00:00.5",
+                                   "1970-01-01T00:00:01.000",
+                                   "2019-02-30T00:00:00.0"])
+          values, valid = s.to_timestamp()
+          print(values)
+          print(valid)
 
         Output:
 
         .. code-block:: python
 
-          [99162322, 113318802]
-
-        """
-        rtn = pyniNVStrings.n_hash(self.m_cptr, devptr)
-        return rtn
-
-    def stoi(self, devptr=0):
-        """
-        Returns integer value represented by each string.
+          [1546300800500        1000           0]
+          [ True  True False]
+
+        """
+        if unit not in _TIME_UNITS:
+            raise ValueError("unit must be 's', 'ms', 'us' or 'ns'")
+        program = _compile_time_format(format)
+        strs, chars, nbytes = self._byte_matrix(_NUMBER_WIDTH)
+        chars = np.pad(chars, ((0, 0), (0, _NUMBER_WIDTH)))
+        rows = np.arange(len(chars))
+        valid = (nbytes >= 0) & (nbytes <= _NUMBER_WIDTH)
+        fields = {'Y': 1970, 'm': 1, 'd': 1, 'H': 0, 'M': 0, 'S': 0, 'f': 0}
+        # pos stays a scalar while all the previous fields are fixed width
+        pos = 0
+
+        def column(i):
+            # the last column is padding, which is read for positions
+            # past the longest string accepted
+            if isinstance(pos, int):
+                return chars[:, min(pos + i, chars.shape[1] - 1)]
+            return chars[rows, np.minimum(pos + i, chars.shape[1] - 1)]
+
+        for field, item in program:
+            if field is None:
+                for i, byte in enumerate(item):
+                    valid &= column(i) == byte
+                pos = pos + len(item)
+                continue
+            width = item or 9
+            value = np.zeros(len(chars), dtype=np.int64)
+            ndigits = np.zeros(len(chars), dtype=np.int64)
+            for i in range(width):
+                digit = column(i).astype(np.int64) - ord('0')
+                active = (digit >= 0) & (digit <= 9) & (ndigits == i)
+                value = np.where(active, value * 10 + digit, value)
+                ndigits += active
+            if item:
+                valid &= ndigits == width
+            else:
+                valid &= ndigits > 0
+                # fraction scaled to nanoseconds
+                value *= 10 ** (9 - ndigits)
+            fields[field] = value
+            pos = pos + (item or ndigits)
+        valid &= nbytes == pos
+        year, month, day = fields['Y'], fields['m'], fields['d']
+        leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+        mdays = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+        valid &= (month >= 1) & (month <= 12) & (day >= 1)
+        valid &= day <= mdays[np.clip(month, 0, 12)] + (leap & (month == 2))
+        valid &= (fields['H'] < 24) & (fields['M'] < 60) & (fields['S'] < 60)
+        seconds = _days_from_civil(year, month, day) * 86400 + \
+            fields['H'] * 3600 + fields['M'] * 60 + fields['S']
+        scale = _TIME_UNITS[unit]
+        rtn = seconds * scale + fields['f'] // (1000000000 // scale)
+        return np.where(valid, rtn, 0), valid
+
+    def ip_to_int(self):
+        """
+        Returns the unsigned 32-bit value of each IPv4 address along
+        with a validity mask.
+
+        Each string must be 4 decimal values from 0 to 255 separated
+        by periods. Other strings are invalid and their value is 0.
 
-        Parameters
-        ----------
-            devptr : GPU memory pointer
-                Where resulting integer values will be written.
-                Memory must be able to hold at least size() of int32 values.
+        Returns
+        -------
+        Tuple of the numpy uint32 array of values and numpy bool array
+        which is True for each string that was converted.
 
         Examples
         --------
         .. code-block:: python
 
           import nvstrings
-          import numpy as np
-          s = nvstrings.to_device(["1234","-876","543.2","-0.12",".55""])
-          print(s.stoi())
+          s = nvstrings.to_device(["192.168.0.1","10.0.0.256","10.0.0"])
+          values, valid = s.ip_to_int()
+          print(values)
+          print(valid)
 
         Output:
 
         .. code-block:: python
 
-          [1234, -876, 543, 0, 0]
-
-        """
-        rtn = pyniNVStrings.n_stoi(self.m_cptr, devptr)
-        return rtn
-
-    def stof(self, devptr=0):
-        """
-        Returns float values represented by each string.
-
-        Parameters
-        ----------
-            devptr : GPU memory pointer
-                Where resulting float values will be written.
-                Memory must be able to hold at least size() of float32 values
+          [3232235521          0          0]
+          [ True False False]
+
+        """
+        strs, chars, nbytes = self._byte_matrix(15)
+        valid = (nbytes >= 7) & (nbytes <= 15)
+        value = np.zeros(len(chars), dtype=np.int64)
+        octet = np.zeros(len(chars), dtype=np.int64)
+        ndigits = np.zeros(len(chars), dtype=np.int64)
+        dots = np.zeros(len(chars), dtype=np.int64)
+        for col in range(chars.shape[1]):
+            active = col < nbytes
+            digit = chars[:, col].astype(np.int64) - ord('0')
+            isdigit = active & (digit >= 0) & (digit <= 9)
+            isdot = active & (chars[:, col] == ord('.'))
+            valid &= ~active | isdigit | isdot
+            valid &= ~isdot | (ndigits > 0)
+            value = np.where(isdot, value * 256 + octet, value)
+            octet = np.where(isdot, 0, octet)
+            ndigits = np.where(isdot, 0, ndigits)
+            dots += isdot
+            octet = np.where(isdigit, octet * 10 + digit, octet)
+            ndigits += isdigit
+            valid &= (octet <= 255) & (ndigits <= 3)
+        valid &= (dots == 3) & (ndigits > 0)
+        rtn = np.where(valid, value * 256 + octet, 0).astype(np.uint32)
+        return rtn, valid
+
+    def is_ipv4(self):
+        """
+        Return array of boolean values with True for strings that are
+        IPv4 addresses as accepted by ip_to_int().
 
         Examples
         --------
         .. code-block:: python
 
           import nvstrings
-          import numpy as np
-          from librmm_cffi import librmm
-          s = nvstrings.to_device(["1234","-876","543.2","-0.12",".55"])
-          print(s.stof())
+          s = nvstrings.to_device(["192.168.0.1","1.2.3.4.5","a.b.c.d"])
+          print(s.is_ipv4())
 
         Output:
 
         .. code-block:: python
 
-          [1234.0, -876.0, 543.2000122070312,
-           -0.11999999731779099, 0.550000011920929]
+          [ True False False]
 
         """
-        rtn = pyniNVStrings.n_stof(self.m_cptr, devptr)
-        return rtn
+        return self.ip_to_int()[1]
 
     def cat(self, others=None, sep=None, na_rep=None):
         """
@@ -390,7 +2182,7 @@ class nvstrings:
             rtn = nvstrings(rtn)
         return rtn
 
-    def split(self, delimiter=None, n=-1):
+    def split(self, delimiter=None, n=-1, flat=False):
         """
         Returns an array of nvstrings each representing the split
         of each individual string.
@@ -404,6 +2196,15 @@ class nvstrings:
             n : int
                 Maximum number of strings to return for each split.
 
+            flat : bool
+                If True, a single nvstrings of all the results is
+                returned along with a numpy int32 array of size()+1
+                offsets. The results of string i are at positions
+                offsets[i] to offsets[i+1].
+                The work is proportional to the number of results
+                rather than size() times the most results of any
+                string.
+
         Examples
         --------
         .. code-block:: python
@@ -423,7 +2224,22 @@ class nvstrings:
           ["goodbye"]
           ["well","said"]
 
+        .. code-block:: python
+
+          strs, offsets = s.split(' ', flat=True)
+          print(strs)
+          print(offsets)
+
+        Output:
+
+        .. code-block:: python
+
+          ["hello","world","goodbye","well","said"]
+          [0 2 3 5]
+
         """
+        if flat:
+            return self._split_flat(delimiter, n, False)
         strs = pyniNVStrings.n_split(self.m_cptr, delimiter, n)
         rtn = []
         for cptr in strs:
@@ -433,20 +2249,351 @@ class nvstrings:
                 rtn.append(None)
         return rtn
 
-    def rsplit(self, delimiter=None, n=-1):
-        """
-        Returns an array of nvstrings each representing the split of each
-        individual string. The delimiter is searched for from the end of
-        each string.
+    def rsplit(self, delimiter=None, n=-1, flat=False):
+        """
+        Returns an array of nvstrings each representing the split of each
+        individual string. The delimiter is searched for from the end of
+        each string.
+
+        Parameters
+        ----------
+            delimiter : str
+                The character used to locate the split points of each
+                string. Default is space.
+
+            n : int
+                Maximum number of strings to return for each split.
+
+            flat : bool
+                If True, a single nvstrings of all the results is
+                returned along with a numpy int32 array of size()+1
+                offsets. The results of string i are at positions
+                offsets[i] to offsets[i+1].
+                The work is proportional to the number of results
+                rather than size() times the most results of any
+                string.
+
+        Examples
+        --------
+        .. code-block:: python
+
+          import nvstrings
+
+          strs = nvstrings.to_device(["hello world","goodbye","up in arms"])
+          for s in strs.rsplit(' ',2):
+            print(s)
+
+
+        Output:
+
+        .. code-block:: python
+
+          ['hello', 'world']
+          ['goodbye']
+          ['up in', 'arms']
+
+        """
+        if flat:
+            return self._split_flat(delimiter, n, True)
+        strs = pyniNVStrings.n_rsplit(self.m_cptr, delimiter, n)
+        rtn = []
+        for cptr in strs:
+            if cptr != 0:
+                rtn.append(nvstrings(cptr))
+            else:
+                rtn.append(None)
+        return rtn
+
+    def _split_flat(self, delimiter, n, reverse):
+        """
+        Return the flat results of split() or rsplit().
+        Each pass splits the remainders of the previous pass into twice
+        as many pieces so the column slots stay proportional to the
+        number of tokens rather than rows times the longest row.
+        """
+        parts = []
+        strs = self
+        rows = np.arange(self.size())
+        done = 0
+        width = 2
+        while True:
+            pieces = width if n <= 0 else min(width, n - done)
+            if reverse:
+                columns = strs.rsplit_column(delimiter, pieces)
+            else:
+                columns = strs.split_column(delimiter, pieces)
+            if len(columns) == 0:
+                break
+            keep = _valid_columns(columns)
+            # the remainder of a row split into all the pieces is
+            # split again by the next pass
+            last = 0 if reverse else pieces - 1
+            more = np.zeros(len(rows), dtype=np.bool_)
+            if len(columns) == pieces and pieces == width and \
+               (n <= 0 or done + pieces < n):
+                more = keep[:, last].copy()
+                keep[more, last] = False
+            rank = -len(parts) if reverse else len(parts)
+            parts.append((columns, rows, keep, rank))
+            more = np.flatnonzero(more)
+            if len(more) == 0:
+                break
+            strs = columns[last].sublist(more.tolist())
+            rows = rows[more]
+            done += pieces - 1
+            width *= 2
+        return self._flatten(parts)
+
+    def _findall_flat(self, pat):
+        """
+        Return the flat results of findall().
+        Strings are grouped by their number of matches so each group
+        only needs up to twice as many columns as its matches.
+        """
+        parts = []
+        counts = np.maximum(np.asarray(self.count(pat), dtype=np.int64), 0)
+        groups = np.zeros(len(counts), dtype=np.int64)
+        groups[counts > 0] = np.log2(counts[counts > 0]).astype(np.int64)
+        for group in np.unique(groups[counts > 0]):
+            rows = np.flatnonzero((counts > 0) & (groups == group))
+            columns = self.sublist(rows.tolist()).findall_column(pat)
+            if len(columns):
+                parts.append((columns, rows, _valid_columns(columns), 0))
+        return self._flatten(parts)
+
+    def _flatten(self, parts):
+        """
+        Return the strings of the parts in row order along with the
+        offsets of each row. Each part is made up of columns, the row
+        of this instance for each of their entries, a bool matrix of
+        the entries to return and the order of the part within a row.
+        """
+        count = self.size()
+        offsets = np.zeros(count + 1, dtype=np.int32)
+        columns = []
+        keys = []
+        base = 0
+        for cols, rows, keep, rank in parts:
+            idx, col = np.nonzero(keep)
+            keys.append((rows[idx], np.full(len(idx), rank), col,
+                         base + col * len(rows) + idx))
+            columns.extend(cols)
+            base += len(cols) * len(rows)
+        if len(columns) == 0:
+            return to_device([]), offsets
+        rows, ranks, cols, pos = [np.concatenate(key) for key in zip(*keys)]
+        order = np.lexsort((cols, ranks, rows))
+        np.cumsum(np.bincount(rows, minlength=count), out=offsets[1:])
+        return _gather_columns(columns, pos[order]), offsets
+
+    def tokenize(self, delimiter=None, categorize=False):
+        """
+        Split each string into tokens ignoring empty tokens.
+        All tokens are returned in a single instance along with the
+        offsets of the tokens for each string.
+
+        Parameters
+        ----------
+            delimiter : str
+                The character used to locate the split points of
+                each string. Default is space.
+
+            categorize : bool
+                If True, the results are returned as an nvcategory
+                instead of an nvstrings instance.
+
+        Returns
+        -------
+        Tuple of the tokens and a numpy int32 array of size()+1 offsets.
+        The tokens of string i are at positions offsets[i] to
+        offsets[i+1].
+
+        Examples
+        --------
+        .. code-block:: python
+
+          import nvstrings
+
+          s = nvstrings.to_device(["hello  world","goodbye"])
+          tokens, offsets = s.tokenize()
+          print(tokens)
+          print(offsets)
+
+        Output:
+
+        .. code-block:: python
+
+          ["hello","world","goodbye"]
+          [0 2 3]
+
+        """
+        rtn, offsets = self.split(delimiter, flat=True)
+        keep = np.asarray(rtn.len()) > 0
+        if not keep.all():
+            rows = np.repeat(np.arange(self.size()), np.diff(offsets))
+            counts = np.bincount(rows[keep], minlength=self.size())
+            np.cumsum(counts, out=offsets[1:])
+            rtn = rtn.sublist(np.flatnonzero(keep).tolist())
+        if categorize:
+            import nvcategory
+            rtn = nvcategory.from_strings(rtn)
+        return rtn, offsets
+
+    def ngrams(self, n=2, separator='_', delimiter=None, categorize=False):
+        """
+        Generate the word n-grams of each string.
+        The tokens of each string are located as in tokenize() and
+        each group of n consecutive tokens is joined with separator.
+
+        Parameters
+        ----------
+            n : int
+                Number of tokens in each n-gram.
+
+            separator : str
+                String placed between the tokens of each n-gram.
+
+            delimiter : str
+                The character used to locate the tokens of each string.
+                Default is space.
+
+            categorize : bool
+                If True, the results are returned as an nvcategory
+                instead of an nvstrings instance.
+
+        Returns
+        -------
+        Tuple of the n-grams and a numpy int32 array of size()+1 offsets.
+
+        Examples
+        --------
+        .. code-block:: python
+
+          import nvstrings
+
+          s = nvstrings.to_device(["the quick brown fox","jumps"])
+          grams, offsets = s.ngrams(2)
+          print(grams)
+          print(offsets)
+
+        Output:
+
+        .. code-block:: python
+
+          ["the_quick","quick_brown","brown_fox"]
+          [0 3 3]
+
+        """
+        if n < 1:
+            raise ValueError("n must be at least 1")
+        tokens, offsets = self.tokenize(delimiter)
+        counts = np.maximum(np.diff(offsets) - n + 1, 0)
+        pos = _expand_ranges(offsets[:-1], counts)[1]
+        rtn = tokens.sublist(pos.tolist())
+        for i in range(1, n):
+            rtn = rtn.cat(tokens.sublist((pos + i).tolist()), sep=separator)
+        np.cumsum(counts, out=offsets[1:])
+        if categorize:
+            import nvcategory
+            rtn = nvcategory.from_strings(rtn)
+        return rtn, offsets
+
+    def character_ngrams(self, n=2, categorize=False):
+        """
+        Generate the character n-grams of each string.
+
+        Parameters
+        ----------
+            n : int
+                Number of characters in each n-gram.
+
+            categorize : bool
+                If True, the results are returned as an nvcategory
+                instead of an nvstrings instance.
+
+        Returns
+        -------
+        Tuple of the n-grams and a numpy int32 array of size()+1 offsets.
+
+        Examples
+        --------
+        .. code-block:: python
+
+          import nvstrings
+
+          s = nvstrings.to_device(["hello","hi"])
+          grams, offsets = s.character_ngrams(3)
+          print(grams)
+          print(offsets)
+
+        Output:
+
+        .. code-block:: python
+
+          ["hel","ell","llo"]
+          [0 3 3]
+
+        """
+        if n < 1:
+            raise ValueError("n must be at least 1")
+        counts = np.maximum(np.asarray(self.len()) - n + 1, 0)
+        offsets = np.zeros(self.size() + 1, dtype=np.int32)
+        np.cumsum(counts, out=offsets[1:])
+        # each pass slices the n-grams starting at one character position
+        columns = []
+        rows = []
+        for i in range(int(counts.max()) if len(counts) else 0):
+            rows.append(np.flatnonzero(counts > i))
+            strs = self.sublist(rows[-1].tolist())
+            columns.append(strs.slice(i, i + n))
+        if columns:
+            rows = np.concatenate(rows)
+            rtn = _gather_columns(columns, np.argsort(rows, kind='stable'))
+        else:
+            rtn = to_device([])
+        if categorize:
+            import nvcategory
+            rtn = nvcategory.from_strings(rtn)
+        return rtn, offsets
+
+    def tokenize_to_ids(self, vocab, max_len, pad_id=0, unk_id=1,
+                        delimiter=None, subword=False):
+        """
+        Convert each string into a fixed length row of token ids.
+
+        Tokens are located as in tokenize() and looked up in the
+        vocabulary. Rows with more than max_len tokens are truncated
+        and shorter rows are filled with pad_id.
 
         Parameters
         ----------
+            vocab : Vocabulary
+                Tokens and their ids.
+
+            max_len : int
+                Number of ids in each row of the result.
+
+            pad_id : int
+                Id used to fill rows with fewer than max_len tokens.
+
+            unk_id : int
+                Id used for tokens not found in the vocabulary.
+
             delimiter : str
-                The character used to locate the split points of each
-                string. Default is space.
+                The character used to locate the tokens of each string.
+                Default is space.
 
-            n : int
-                Maximum number of strings to return for each split.
+            subword : bool
+                If True, tokens not found in the vocabulary are split
+                into the longest matching vocabulary entries from left
+                to right (WordPiece). Entries continuing a token must
+                start with the '##' prefix. Tokens that cannot be split
+                this way are assigned unk_id.
+
+        Returns
+        -------
+        Tuple of a numpy int32 matrix of size() rows and max_len columns
+        and a numpy int32 array of the number of ids in each row.
 
         Examples
         --------
@@ -454,28 +2601,52 @@ class nvstrings:
 
           import nvstrings
 
-          strs = nvstrings.to_device(["hello world","goodbye","up in arms"])
-          for s in strs.rsplit(' ',2):
-            print(s)
-
+          vocab = nvstrings.Vocabulary(["[PAD]","[UNK]","the","fox",
+                                        "jump","##s"])
+          s = nvstrings.to_device(["the fox jumps","a fox"])
+          ids, lengths = s.tokenize_to_ids(vocab, 4, subword=True)
+          print(ids)
+          print(lengths)
 
         Output:
 
         .. code-block:: python
 
-          ['hello', 'world']
-          ['goodbye']
-          ['up in', 'arms']
-
-        """
-        strs = pyniNVStrings.n_rsplit(self.m_cptr, delimiter, n)
-        rtn = []
-        for cptr in strs:
-            if cptr != 0:
-                rtn.append(nvstrings(cptr))
-            else:
-                rtn.append(None)
-        return rtn
+          [[2 3 4 5]
+           [1 3 0 0]]
+          [4 2]
+
+        """
+        tokens, offsets = self.tokenize(delimiter)
+        ids = vocab.lookup(tokens, -1)
+        unknown = np.flatnonzero(ids < 0)
+        ids[unknown] = unk_id
+        if subword and len(unknown):
+            # split each distinct unknown token only once
+            words, _, inverse = tokens.sublist(unknown.tolist()).unique()
+            pieces = [vocab._wordpiece(word, unk_id)
+                      for word in words.to_host()]
+            counts = np.array([len(p) for p in pieces], dtype=np.int32)
+            starts = np.cumsum(counts) - counts
+            pieces = np.asarray([i for p in pieces for i in p],
+                                dtype=np.int32)
+            # place the pieces where the unknown tokens were
+            sizes = np.ones(len(ids), dtype=np.int32)
+            sizes[unknown] = counts[inverse]
+            ends = np.cumsum(sizes)
+            rtn = np.empty(ends[-1], dtype=np.int32)
+            rtn[ends - sizes] = ids
+            dst = _expand_ranges(ends[unknown] - sizes[unknown],
+                                 counts[inverse])[1]
+            src = _expand_ranges(starts[inverse], counts[inverse])[1]
+            rtn[dst] = pieces[src]
+            ids = rtn
+            offsets = np.concatenate([[0], ends])[offsets]
+        lengths = np.minimum(np.diff(offsets), max_len).astype(np.int32)
+        rows, pos = _expand_ranges(offsets[:-1], lengths)
+        rtn = np.full((self.size(), max_len), pad_id, dtype=np.int32)
+        rtn[rows, pos - offsets[rows]] = ids[pos]
+        return rtn, lengths
 
     def partition(self, delimiter=' '):
         """
@@ -1510,7 +3681,7 @@ class nvstrings:
         rtn = pyniNVStrings.n_rfind(self.m_cptr, sub, start, end, devptr)
         return rtn
 
-    def findall(self, pat):
+    def findall(self, pat, flat=False):
         """
         Find all occurrences of regular expression pattern in each string.
         A new array of nvstrings is created for each string in this instance.
@@ -1520,6 +3691,15 @@ class nvstrings:
             pat : str
                 The regex pattern used to search for substrings
 
+            flat : bool
+                If True, a single nvstrings of all the results is
+                returned along with a numpy int32 array of size()+1
+                offsets. The results of string i are at positions
+                offsets[i] to offsets[i+1].
+                The work is proportional to the number of results
+                rather than size() times the most results of any
+                string.
+
         Examples
         --------
 
@@ -1541,6 +3721,8 @@ class nvstrings:
           ["a","b","b"]
 
         """
+        if flat:
+            return self._findall_flat(pat)
         strs = pyniNVStrings.n_findall(self.m_cptr, pat)
         rtn = []
         for cptr in strs:
@@ -2070,7 +4252,7 @@ class nvstrings:
             rtn = nvstrings(rtn)
         return rtn
 
-    def sort(self, stype, asc=True):
+    def sort(self, stype, asc=True, use_keys=False):
         """
         Sort this list by name (2) or length (1) or both (3).
         Sorting can help improve performance for other operations.
@@ -2090,6 +4272,13 @@ class nvstrings:
           asc : bool
             Whether to sort ascending (True) or descending (False)
 
+          use_keys : bool
+            If True, the strings are ordered on the host using the
+            cached sort_keys() and only strings with equal keys are
+            compared. This helps when the same instance is sorted
+            repeatedly and most strings differ within their first
+            8 bytes. Otherwise the native sort is used.
+
         Examples
         --------
         .. code-block:: python
@@ -2106,12 +4295,14 @@ class nvstrings:
           ['bb', 'aaa', 'aaaabb']
 
         """
+        if use_keys:
+            return self.sublist(self.order(stype, asc, use_keys=True))
         rtn = pyniNVStrings.n_sort(self.m_cptr, stype, asc)
         if rtn is not None:
             rtn = nvstrings(rtn)
         return rtn
 
-    def order(self, stype, asc=True, devptr=0):
+    def order(self, stype, asc=True, devptr=0, k=None, use_keys=False):
         """
         Sort this list by name (2) or length (1) or both (3).
         This sort only provides the new indexes and does not reorder the
@@ -2136,6 +4327,18 @@ class nvstrings:
                 Where index values will be written.
                 Must be able to hold at least size() of int32 values.
 
+          k : int
+                If specified, only the indexes of the first k strings
+                in sorted order are returned. A partial selection is
+                used instead of sorting all the strings unless most
+                of them share their first 8 bytes with the k-th string.
+                The devptr parameter is not supported with k.
+
+          use_keys : bool
+                If True, the strings are ordered on the host using the
+                cached sort_keys() as described in sort().
+                The devptr parameter is not supported with use_keys.
+
         Examples
         --------
         .. code-block:: python
@@ -2144,17 +4347,539 @@ class nvstrings:
 
           s = nvstrings.to_device(["aaa", "bb", "aaaabb"])
           print(s.order(2))
+          print(s.order(2, k=2))
 
         Output:
 
         .. code-block:: python
 
           [1, 0, 2]
+          [0, 2]
+
+        """
+        if k is not None:
+            if devptr:
+                raise ValueError("devptr is not supported with k")
+            return self._select(k, stype, asc).tolist()
+        if use_keys:
+            if devptr:
+                raise ValueError("devptr is not supported with use_keys")
+            rows = np.arange(self.size(), dtype=np.int32)
+            return self._order_rows(rows, stype, asc).tolist()
+        rtn = pyniNVStrings.n_order(self.m_cptr, stype, asc, devptr)
+        return rtn
+
+    def _select(self, k, stype, asc):
+        """Return the indexes of the first k strings in sorted order."""
+        count = self.size()
+        k = max(0, min(k, count))
+        if k == 0 or k == count:
+            return self._order_rows(np.arange(k, dtype=np.int32), stype, asc)
+        prefixes, lengths, nbytes = self._keys()
+        # 64-bit selection key: length and/or the leading prefix bytes
+        keys = (lengths + 1).astype(np.uint64)
+        if stype == 2:
+            keys = prefixes
+        elif stype == 3:
+            keys = (keys << np.uint64(32)) | (prefixes >> np.uint64(32))
+        if not asc:
+            keys = ~keys
+        kth = np.partition(keys, k - 1)[k - 1]
+        rtn = np.flatnonzero(keys < kth)
+        ties = np.flatnonzero(keys == kth)
+        need = k - len(rtn)
+        if stype == 1:
+            ties = ties[:need]
+        elif len(ties) > need and len(ties) > count // _SELECT_MAX_TIES:
+            # comparing most of the strings costs more than sorting
+            rtn = pyniNVStrings.n_order(self.m_cptr, stype, asc, 0)
+            return np.asarray(rtn[:k], dtype=np.int32)
+        else:
+            ties = self._select_ties(ties, need, asc)
+        rtn = np.sort(np.concatenate([rtn, ties])).astype(np.int32)
+        return self._order_rows(rtn, stype, asc)
+
+    def _select_ties(self, rows, need, asc):
+        """
+        Return the first need of the rows in name order. The rows must
+        have equal sort keys. They are narrowed by comparing 8
+        characters at a time so only rows still equal are copied again.
+        """
+        lengths = self._keys()[1]
+        selected = []
+        start = 0
+        while len(rows) > need and lengths[rows].max() >= start:
+            strs = self.sublist(rows.tolist()).slice(start, start + 8)
+            # null strings are ordered before empty strings
+            window = np.array([b'' if str is None else
+                               b'\x01' + str.encode('utf-8')
+                               for str in strs.to_host()], dtype='S33')
+            values, ranks = np.unique(window, return_inverse=True)
+            if not asc:
+                ranks = len(values) - 1 - ranks
+            kth = np.partition(ranks, need - 1)[need - 1]
+            selected.append(rows[ranks < kth])
+            need -= len(selected[-1])
+            rows = rows[ranks == kth]
+            start += 8
+        selected.append(rows[:need])
+        return np.concatenate(selected)
+
+    def _keys(self):
+        """Return the cached prefixes, lengths and prefix byte counts."""
+        if self._sort_keys is None:
+            strs = self.slice(0, 8).to_host()
+            prefixes = []
+            nbytes = np.empty(len(strs), dtype=np.int8)
+            for i, prefix in enumerate(strs):
+                if prefix is None:
+                    prefixes.append(b'')
+                    nbytes[i] = -1
+                else:
+                    b = prefix.encode('utf-8')
+                    prefixes.append(b[:8])
+                    nbytes[i] = min(len(b), 9)
+            lengths = np.asarray(self.len(), dtype=np.int32)
+            # strings longer than the prefix are only ordered by name
+            # after comparing the full strings
+            nbytes[lengths > 8] = 9
+            prefixes = np.asarray(prefixes, dtype='S8').view('>u8')
+            self._sort_keys = (prefixes.astype(np.uint64), lengths, nbytes)
+        return self._sort_keys
+
+    def _order_rows(self, rows, stype, asc, equal=False):
+        """
+        Return the specified row indexes ordered by the sort keys.
+        The sort is stable and only rows with equal keys are resolved
+        by comparing the full strings. If equal is True, a bool array
+        which is True where the string of each ordered row equals the
+        string of the next row is also returned (stype 2 or 3 only).
+        """
+        prefixes, lengths, nbytes = self._keys()
+        cols = [lengths]
+        if stype == 2:
+            cols = [prefixes, nbytes]
+        elif stype == 3:
+            cols = [lengths, prefixes, nbytes]
+        keys = [col[rows] for col in cols]
+        if not asc:
+            keys = [~key for key in keys]
+        rows = rows[np.lexsort(keys[::-1])]
+        same = np.zeros(max(len(rows) - 1, 0), dtype=np.bool_)
+        if stype != 1 and len(rows) > 1:
+            same[:] = True
+            for col in cols:
+                key = col[rows]
+                same &= key[1:] == key[:-1]
+            # runs of truncated prefixes that are equal must be compared
+            ties = same & (nbytes[rows][1:] == 9)
+            if ties.any():
+                self._resolve_ties(rows, same, ties, asc)
+        if equal:
+            return rows, same
+        return rows
+
+    def _resolve_ties(self, rows, same, ties, asc):
+        """
+        Order the runs of rows whose sort keys are equal by comparing
+        their full strings and update the equality flags of each run.
+        """
+        starts = np.flatnonzero(ties & ~np.concatenate([[False], ties[:-1]]))
+        ends = np.flatnonzero(ties & ~np.concatenate([ties[1:], [False]]))
+        ends += 2
+        pos = np.concatenate([np.arange(b, e) for b, e in zip(starts, ends)])
+        strs = self.sublist(rows[pos].tolist()).to_host()
+        i = 0
+        for b, e in zip(starts, ends):
+            run_strs = strs[i:i + e - b]
+            run = sorted(range(e - b), key=run_strs.__getitem__,
+                         reverse=not asc)
+            rows[b:e] = rows[b:e][run]
+            run_strs = [run_strs[j] for j in run]
+            same[b:e - 1] = [x == y for x, y in
+                             zip(run_strs[:-1], run_strs[1:])]
+            i += e - b
+
+    def sort_keys(self):
+        """
+        Return the binary sort keys for this instance.
+
+        Each string is represented by its first 8 bytes (UTF-8) packed
+        big-endian into an unsigned 64-bit integer, zero padded for
+        shorter strings, along with its length.
+        The keys are computed once and cached on this instance.
+        They are used by nsmallest(), nlargest(), order() with k,
+        searchsorted() and by sort(), order() and unique() when
+        use_keys is True, so only strings with equal keys need to be
+        fully compared.
+
+        Returns
+        -------
+          tuple: numpy uint64 array of prefixes and int32 array of
+          lengths (-1 for null strings)
+
+        Examples
+        --------
+        .. code-block:: python
+
+          import nvstrings
+
+          s = nvstrings.to_device(["ab", "b"])
+          prefixes, lengths = s.sort_keys()
+          print([hex(p) for p in prefixes])
+          print(lengths)
+
+        Output:
+
+        .. code-block:: python
+
+          ['0x6162000000000000', '0x6200000000000000']
+          [2 1]
 
         """
-        rtn = pyniNVStrings.n_order(self.m_cptr, stype, asc, devptr)
+        prefixes, lengths, nbytes = self._keys()
+        return prefixes, lengths
+
+    def isin(self, values, bitmask=False):
+        """
+        Return array of boolean values with True for strings that are
+        equal to any of the specified values. Null strings are never
+        found.
+
+        Parameters
+        ----------
+          values : StringSet, nvstrings, list or set of str
+            Strings to look for. Use a StringSet to reuse the same
+            values across multiple calls.
+
+          bitmask : bool
+            If True, the results are packed into a bit-array (uint8)
+            with the least significant bit of the first byte
+            representing the first string.
+
+        Examples
+        --------
+        .. code-block:: python
+
+          import nvstrings
+
+          s = nvstrings.to_device(["hello", "there", "world"])
+          print(s.isin({"world", "hello"}))
+
+        Output:
+
+        .. code-block:: python
+
+          [ True False  True]
+
+        """
+        if not isinstance(values, StringSet):
+            values = StringSet(values)
+        rows = _probe(values._index, values._strs, self)[0]
+        rtn = np.zeros(self.size(), dtype=np.bool_)
+        rtn[rows] = True
+        if bitmask:
+            rtn = np.packbits(rtn, bitorder='little')
         return rtn
 
+    def unique(self, keep='first', sort=False, use_keys=False):
+        """
+        Return the distinct strings of this instance.
+
+        Parameters
+        ----------
+          keep : str
+            'first' returns the index of the first occurrence of each
+            distinct string and 'last' returns the index of the last.
+
+          sort : bool
+            If False, the strings are returned in the order of the
+            occurrences identified by keep. If True, the strings are
+            sorted by name.
+
+          use_keys : bool
+            If True, equal strings are found by ordering the cached
+            sort_keys() on the host and comparing only the strings
+            with equal keys. Otherwise a category is built with the
+            native library.
+
+        Returns
+        -------
+          tuple: nvstrings of distinct strings, numpy int32 array of
+          their indexes in this instance and numpy int32 array mapping
+          each string in this instance to its distinct string
+
+        Examples
+        --------
+        .. code-block:: python
+
+          import nvstrings
+
+          s = nvstrings.to_device(["eee", "aaa", "eee", "dddd"])
+          strs, idx, inverse = s.unique()
+          print(strs)
+          print(idx)
+          print(inverse)
+
+        Output:
+
+        .. code-block:: python
+
+          ['eee', 'aaa', 'dddd']
+          [0 1 3]
+          [0 1 0 2]
+
+        """
+        import nvcategory
+        if keep not in ('first', 'last'):
+            raise ValueError("keep must be 'first' or 'last'")
+        if use_keys:
+            rows = np.arange(self.size(), dtype=np.int32)
+            rows, same = self._order_rows(rows, 2, True, equal=True)
+            values = np.empty(len(rows), dtype=np.int64)
+            values[rows] = np.concatenate([[0], np.cumsum(~same)])
+        else:
+            values = nvcategory.from_strings(self)._host_values()
+        if keep == 'first':
+            rtn = np.unique(values, return_index=True)[1]
+        else:
+            rtn = np.unique(values[::-1], return_index=True)[1]
+            rtn = len(values) - 1 - rtn
+        if sort:
+            order = np.arange(len(rtn))
+        else:
+            order = np.argsort(rtn, kind='stable')
+        rtn = rtn[order].astype(np.int32)
+        inverse = np.empty(len(rtn), dtype=np.int32)
+        inverse[order] = np.arange(len(rtn))
+        return self.sublist(rtn.tolist()), rtn, inverse[values]
+
+    def is_sorted(self, stype=2, asc=True):
+        """
+        Return True if this list is sorted by name (2) or length (1)
+        or both (3).
+
+        Parameters
+        ----------
+          stype : int
+            Type of sort to check. See sort() for details.
+
+          asc : bool
+            Whether to check for ascending (True) or descending (False)
+
+        Examples
+        --------
+        .. code-block:: python
+
+          import nvstrings
+
+          s = nvstrings.to_device(["aaa", "bb", "aaaabb"])
+          print(s.is_sorted())
+          print(s.sort(2).is_sorted())
+
+        Output:
+
+        .. code-block:: python
+
+          False
+          True
+
+        """
+        prefixes, lengths, nbytes = self._keys()
+        cols = [lengths]
+        if stype == 2:
+            cols = [prefixes, nbytes]
+        elif stype == 3:
+            cols = [lengths, prefixes, nbytes]
+        # compare each string with the next one using the keys first
+        cmp = np.zeros(max(self.size() - 1, 0), dtype=np.int8)
+        for col in cols:
+            key = (col[1:] > col[:-1]).astype(np.int8)
+            key -= col[1:] < col[:-1]
+            cmp = np.where(cmp == 0, key, cmp)
+        if not asc:
+            cmp = -cmp
+        if (cmp < 0).any():
+            return False
+        if stype == 1:
+            return True
+        ties = np.flatnonzero((cmp == 0) & (nbytes[1:] == 9) &
+                              (nbytes[:-1] == 9))
+        if len(ties) == 0:
+            return True
+        strs = self.sublist(np.concatenate([ties, ties + 1]).tolist())
+        strs = strs.to_host()
+        for first, second in zip(strs[:len(ties)], strs[len(ties):]):
+            if (first > second) if asc else (first < second):
+                return False
+        return True
+
+    def searchsorted(self, values, side='left'):
+        """
+        Return the positions where the given strings would be inserted
+        to keep this list sorted.
+
+        This list must already be sorted by name in ascending order.
+        See is_sorted(). The sort keys of both lists are searched first
+        and full strings are only compared for equal keys.
+
+        Parameters
+        ----------
+          values : nvstrings or list of str
+            Strings to locate in this instance.
+
+          side : str
+            If 'left', the position of the first string equal to each
+            value is returned. If 'right', the position after the last
+            equal string is returned.
+
+        Returns
+        -------
+          numpy.ndarray: int32 position for each value
+
+        Examples
+        --------
+        .. code-block:: python
+
+          import nvstrings
+
+          s = nvstrings.to_device(["aaa", "bb", "bb", "ccc"])
+          print(s.searchsorted(["bb", "c", "a"]))
+          print(s.searchsorted(["bb"], side='right'))
+
+        Output:
+
+        .. code-block:: python
+
+          [1 3 0]
+          [3]
+
+        """
+        if side not in ('left', 'right'):
+            raise ValueError("side must be 'left' or 'right'")
+        if not isinstance(values, nvstrings):
+            values = to_device(list(values))
+        if self.size() == 0:
+            return np.zeros(values.size(), dtype=np.int32)
+        prefixes, lengths, nbytes = self._keys()
+        vprefixes, vlengths, vnbytes = values._keys()
+        # rank the distinct prefixes so prefix and byte count combine
+        # into a single searchable integer key
+        ranks = np.cumsum(prefixes[1:] != prefixes[:-1], dtype=np.int64)
+        ranks = np.concatenate([[0], ranks])[:len(prefixes)]
+        keys = ranks * 16 + nbytes + 1
+        pos = np.searchsorted(prefixes, vprefixes, 'left')
+        found = pos < len(prefixes)
+        found[found] = prefixes[pos[found]] == vprefixes[found]
+        vkeys = np.where(found, ranks[np.minimum(pos, len(ranks) - 1)], 0)
+        vkeys = vkeys * 16 + vnbytes + 1
+        starts = np.searchsorted(keys, vkeys, 'left')
+        ends = np.searchsorted(keys, vkeys, 'right')
+        rtn = np.where(found, starts if side == 'left' else ends, pos)
+        # values with truncated prefixes equal to some of these strings
+        ties = np.flatnonzero(found & (vnbytes == 9) & (ends > starts))
+        if len(ties):
+            strs = values.sublist(ties.tolist()).to_host()
+            search = bisect.bisect_left if side == 'left' else \
+                bisect.bisect_right
+            # the candidate ranges are fetched once and shared by all
+            # the values with the same key
+            ranges, index, inverse = np.unique(
+                starts[ties], return_index=True, return_inverse=True)
+            counts = ends[ties][index] - ranges
+            rows = _expand_ranges(ranges, counts)[1]
+            rows = self.sublist(rows.tolist()).to_host()
+            lo = (np.cumsum(counts) - counts).tolist()
+            hi = np.cumsum(counts).tolist()
+            for i, value, j in zip(ties, strs, inverse.ravel()):
+                pos = search(rows, value, lo[j], hi[j])
+                rtn[i] = starts[i] + pos - lo[j]
+        return rtn.astype(np.int32)
+
+    def nsmallest(self, k, stype=2):
+        """
+        Return the first k strings by name (2) or length (1) or both (3)
+        along with their indexes.
+        Only a partial selection is performed so the cost grows with
+        size() rather than with a full sort.
+
+        Parameters
+        ----------
+          k : int
+            Number of strings to return.
+
+          stype : int
+            Type of sort to use. See sort() for details.
+
+        Returns
+        -------
+          tuple: nvstrings of the selected strings and a numpy int32
+          array of their indexes in this instance
+
+        Examples
+        --------
+        .. code-block:: python
+
+          import nvstrings
+
+          s = nvstrings.to_device(["aaa", "bb", "aaaabb", "c"])
+          strs, idx = s.nsmallest(2, 1)
+          print(strs)
+          print(idx)
+
+        Output:
+
+        .. code-block:: python
+
+          ['c', 'bb']
+          [3 1]
+
+        """
+        rtn = self._select(k, stype, True)
+        return self.sublist(rtn.tolist()), rtn
+
+    def nlargest(self, k, stype=2):
+        """
+        Return the last k strings by name (2) or length (1) or both (3)
+        in descending order along with their indexes.
+        Only a partial selection is performed so the cost grows with
+        size() rather than with a full sort.
+
+        Parameters
+        ----------
+          k : int
+            Number of strings to return.
+
+          stype : int
+            Type of sort to use. See sort() for details.
+
+        Returns
+        -------
+          tuple: nvstrings of the selected strings and a numpy int32
+          array of their indexes in this instance
+
+        Examples
+        --------
+        .. code-block:: python
+
+          import nvstrings
+
+          s = nvstrings.to_device(["aaa", "bb", "aaaabb", "c"])
+          strs, idx = s.nlargest(2)
+          print(strs)
+          print(idx)
+
+        Output:
+
+        .. code-block:: python
+
+          ['c', 'bb']
+          [3 1]
+
+        """
+        rtn = self._select(k, stype, False)
+        return self.sublist(rtn.tolist()), rtn
+
     def sublist(self, indexes, count=0):
         """
         Return a sublist of strings from this instance.
@@ -2265,3 +4990,153 @@ class nvstrings:
         """
         rtn = pyniNVStrings.n_find_multiple(self.m_cptr, strs, devptr)
         return rtn
+
+
+class StringSet:
+    """
+    Set of strings indexed by hash value for membership tests.
+
+    The index is built once and may be passed to nvstrings.isin()
+    any number of times.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+      import nvstrings
+      deny = nvstrings.StringSet(["bad", "worse"])
+      s = nvstrings.to_device(["good", "bad"])
+      print(s.isin(deny))
+
+    Output:
+
+    .. code-block:: python
+
+      [False  True]
+
+    """
+
+    def __init__(self, values):
+        """
+        Parameters
+        ----------
+          values : nvstrings, list or set of str
+            Strings in the set.
+        """
+        if not isinstance(values, nvstrings):
+            values = to_device(list(values))
+        self._strs = values.unique()[0]
+        self._index = _hash_index(self._strs)
+
+    def __repr__(self):
+        return "<StringSet count={}>".format(self.size())
+
+    def size(self):
+        """The number of distinct strings in the set."""
+        return self._strs.size()
+
+    def to_strings(self):
+        """Return the distinct strings of the set as an nvstrings."""
+        return self._strs
+
+
+class Vocabulary:
+    """
+    Maps tokens to integer ids using a hash index of the tokens.
+    The id of each token is its position in the vocabulary.
+    Use with nvstrings.tokenize_to_ids().
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+      import nvstrings
+      vocab = nvstrings.Vocabulary(["[UNK]","hello","world"])
+      print(vocab.lookup(nvstrings.to_device(["world","moon"])))
+
+    Output:
+
+    .. code-block:: python
+
+      [ 2 -1]
+
+    """
+
+    def __init__(self, tokens):
+        """
+        Parameters
+        ----------
+          tokens : nvstrings or list of str
+            Tokens of the vocabulary in id order.
+        """
+        if not isinstance(tokens, nvstrings):
+            tokens = to_device(list(tokens))
+        self._strs = tokens
+        self._index = _hash_index(tokens)
+        self._ids = None
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Create a vocabulary from a UTF-8 text file with one token
+        on each line.
+        """
+        with open(path, encoding='utf-8') as f:
+            return cls([line.rstrip('\r\n') for line in f])
+
+    def __repr__(self):
+        return "<Vocabulary count={}>".format(self.size())
+
+    def size(self):
+        """The number of tokens in the vocabulary."""
+        return self._strs.size()
+
+    def lookup(self, strs, unk_id=-1):
+        """
+        Return the id of each string.
+
+        Parameters
+        ----------
+          strs : nvstrings
+            Tokens to look up.
+
+          unk_id : int
+            Id returned for strings not in the vocabulary.
+
+        Returns
+        -------
+          numpy.ndarray: int32 id of each string
+
+        """
+        rows, ids = _probe(self._index, self._strs, strs)
+        # the lowest id wins for tokens appearing more than once
+        order = np.lexsort((ids, rows))
+        rows, first = np.unique(rows[order], return_index=True)
+        rtn = np.full(strs.size(), unk_id, dtype=np.int32)
+        rtn[rows] = ids[order][first]
+        return rtn
+
+    def _wordpiece(self, word, unk_id, prefix='##'):
+        """Return the ids of the longest vocabulary pieces of word."""
+        if self._ids is None:
+            self._ids = {}
+            for i, token in enumerate(self._strs.to_host()):
+                self._ids.setdefault(token, i)
+        rtn = []
+        start = 0
+        while start < len(word):
+            end = len(word)
+            while end > start:
+                piece = word[start:end]
+                if start > 0:
+                    piece = prefix + piece
+                if piece in self._ids:
+                    break
+                end -= 1
+            if end == start:
+                return [unk_id]
+            rtn.append(self._ids[piece])
+            start = end
+        return rtn
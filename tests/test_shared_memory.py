@@ -0,0 +1,67 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip('pyniNVStrings')
+
+import nvcategory  # noqa: E402
+import nvstrings  # noqa: E402
+
+READER = """
+import sys
+import nvcategory
+import nvstrings
+print(({})(sys.argv[1]))
+"""
+
+
+def read_in_new_process(reader, name):
+    """Call reader on the segment in an independent Python process."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    return subprocess.check_output(
+        [sys.executable, '-c', READER.format(reader), name],
+        env=env, universal_newlines=True).strip()
+
+
+def test_independent_readers_do_not_unlink_segment():
+    s = nvstrings.to_device(["hello", None, "world"])
+    shm = s.to_shared_memory()
+    try:
+        for _ in range(2):
+            rtn = read_in_new_process(
+                'lambda name: nvstrings.from_shared_memory(name).to_host()',
+                shm.name)
+            assert rtn == "['hello', None, 'world']"
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_independent_category_readers_do_not_unlink_segment():
+    c = nvcategory.to_device(["eee", "aaa", "eee", "dddd"])
+    shm = c.to_shared_memory()
+    try:
+        for _ in range(2):
+            rtn = read_in_new_process(
+                'lambda name: nvcategory.from_shared_memory(name)'
+                '.to_strings().to_host()', shm.name)
+            assert rtn == "['eee', 'aaa', 'eee', 'dddd']"
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_build_error_is_not_hidden():
+    shm = nvstrings.to_device(["hello"]).to_shared_memory()
+
+    def build(*arrays):
+        raise ValueError("bad segment")
+
+    try:
+        with pytest.raises(ValueError, match="bad segment"):
+            nvstrings._from_shared_memory(shm.name, build)
+    finally:
+        shm.close()
+        shm.unlink()